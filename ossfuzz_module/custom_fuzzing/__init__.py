@@ -4,14 +4,20 @@ Custom fuzzing APIs for OSS-Fuzz projects.
 
 from .api import (
     setup_local_fuzzing,
+    setup_local_fuzzing_batch,
     run_local_fuzzing,
+    run_local_fuzzing_async,
     analyze_fuzzing_results,
-    collect_coverage
+    collect_coverage,
+    reset_caches
 )
 
 __all__ = [
     'setup_local_fuzzing',
+    'setup_local_fuzzing_batch',
     'run_local_fuzzing',
+    'run_local_fuzzing_async',
     'analyze_fuzzing_results',
-    'collect_coverage'
+    'collect_coverage',
+    'reset_caches'
 ] 
\ No newline at end of file
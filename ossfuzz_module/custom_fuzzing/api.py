@@ -2,23 +2,87 @@
 Custom fuzzing APIs for running OSS-Fuzz projects locally.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
 import datetime
+import functools
 import os
-import subprocess
 import logging
-import shutil
 import json
 from pathlib import Path
-import tempfile
-import re
 
-from ..utils.client import client
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..utils.client import client, _PLACEHOLDER_FUZZ_TARGET
 from ..utils.common import validate_project_name
 from ..models import OSSFuzzProject, FuzzTarget, FuzzingExecution
 
 logger = logging.getLogger(__name__)
 
+# Stand-in written where a real coverage report would go
+_PLACEHOLDER_COVERAGE_REPORT = b"<html><body><h1>Sample Coverage Report</h1></body></html>"
+
+
+def reset_caches() -> None:
+    """
+    Clear cached project details and fuzz targets.
+    
+    Call this after editing project files in the OSS-Fuzz checkout during
+    the same session.
+    """
+    _cached_project.cache_clear()
+    _cached_fuzz_target.cache_clear()
+
+
+# The OSS-Fuzz directory is part of both cache keys so that pointing the
+# client at another checkout does not return stale entries.
+@functools.lru_cache(maxsize=128)
+def _cached_project(oss_fuzz_dir: str, project_name: str) -> OSSFuzzProject:
+    """Look up project details once per project and OSS-Fuzz checkout."""
+    return client.get_project_details_from_repo(project_name)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_fuzz_target(oss_fuzz_dir: str, project_name: str,
+                        fuzz_target: Optional[str]) -> FuzzTarget:
+    """Resolve the fuzz target to set up once per project, target name and checkout."""
+    project = _cached_project(oss_fuzz_dir, project_name)
+    
+    # Both lookups stop scanning build.sh at the first match
+    target = client.find_fuzz_target(project, fuzz_target) if fuzz_target else None
+    if not target:
+        target = client.get_first_fuzz_target(project)
+        logger.info("Using fuzz target: %s", target.name)
+    return target
+
+
+def _is_placeholder_target(path: Path) -> bool:
+    """Check whether a fuzz target is the placeholder written by setup."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(_PLACEHOLDER_FUZZ_TARGET) + 1) == _PLACEHOLDER_FUZZ_TARGET
+    except OSError:
+        return False
+
+
+def _dumps_stats(stats: Dict[str, Any]) -> bytes:
+    """Serialize fuzzing statistics, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(stats, option=orjson.OPT_INDENT_2)
+    return json.dumps(stats, indent=2).encode()
+
+
+def _loads_stats(data: bytes) -> Dict[str, Any]:
+    """Parse fuzzing statistics, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def setup_local_fuzzing(project_name: str, 
                        fuzz_target: Optional[str] = None,
                        output_dir: Optional[str] = None,
@@ -48,22 +112,12 @@ def setup_local_fuzzing(project_name: str,
     """
     project_name = validate_project_name(project_name)
     
-    # Get project details
-    project = client.get_project_details_from_repo(project_name)
-    
-    # Get available fuzz targets
-    targets = client.get_fuzz_targets(project)
+    # Get project details and available fuzz targets
+    oss_fuzz_dir = str(client.oss_fuzz_dir)
+    project = _cached_project(oss_fuzz_dir, project_name)
     
     # Find the specified target or use the first available one
-    target = None
-    if fuzz_target:
-        target = next((t for t in targets if t.name == fuzz_target), None)
-    if not target and targets:
-        target = targets[0]
-        logger.info(f"Using fuzz target: {target.name}")
-    
-    if not target:
-        raise ValueError(f"No fuzz targets found for project {project_name}")
+    target = _cached_fuzz_target(oss_fuzz_dir, project_name, fuzz_target)
     
     # Set up the fuzzing environment
     return client.setup_fuzzing(
@@ -74,16 +128,97 @@ def setup_local_fuzzing(project_name: str,
         sanitizer=sanitizer
     )
 
+def setup_local_fuzzing_batch(project_names: Sequence[str],
+                             output_dir: Optional[str] = None,
+                             architecture: str = "x86_64",
+                             sanitizer: str = "address",
+                             max_workers: Optional[int] = None,
+                             use_threads: bool = False) -> List[FuzzingExecution]:
+    """
+    Set up local fuzzing for several OSS-Fuzz projects in parallel.
+    
+    Each project is set up with its first available fuzz target in a separate
+    worker process, so build script parsing for one project does not wait on
+    another. With `use_threads`, a thread pool is used instead, which avoids
+    process start-up costs and shares the lookup caches when setup is
+    dominated by waiting on storage rather than parsing.
+    
+    Args:
+        project_names (Sequence[str]): Names of the OSS-Fuzz projects
+        output_dir (str, optional): Parent directory; each project is set up
+            in its own subdirectory
+        architecture (str, optional): Target architecture (default: x86_64)
+        sanitizer (str, optional): Sanitizer to use (default: address)
+        max_workers (int, optional): Number of workers (default: CPU count for
+            processes, the ThreadPoolExecutor default for threads)
+        use_threads (bool, optional): Use threads instead of processes (default: False)
+        
+    Returns:
+        List[FuzzingExecution]: The fuzzing execution sessions, in input order
+        
+    Raises:
+        ValueError: If parameters are invalid
+        RuntimeError: If setup fails
+        
+    Example:
+        >>> executions = setup_local_fuzzing_batch(["curl", "libpng"])
+        >>> print([e.target.name for e in executions])
+        ['curl_fuzzer', 'libpng_read_fuzzer']
+    """
+    project_names = [validate_project_name(name) for name in project_names]
+    output_dirs = [
+        os.path.join(output_dir, name) if output_dir else None
+        for name in project_names
+    ]
+    
+    # Worker processes started with spawn or forkserver get a fresh client,
+    # so the checkout the caller configured is passed along explicitly
+    setup = functools.partial(
+        _setup_local_fuzzing_worker,
+        oss_fuzz_dir=client.oss_fuzz_dir,
+        architecture=architecture,
+        sanitizer=sanitizer
+    )
+    pool = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    with pool(max_workers=max_workers) as executor:
+        return list(executor.map(setup, project_names, output_dirs))
+
+
+def _setup_local_fuzzing_worker(project_name: str,
+                                output_dir: Optional[str],
+                                oss_fuzz_dir: Optional[str],
+                                architecture: str,
+                                sanitizer: str) -> FuzzingExecution:
+    """Run setup_local_fuzzing for one project inside a pool worker."""
+    if oss_fuzz_dir and client.oss_fuzz_dir != oss_fuzz_dir:
+        client.oss_fuzz_dir = oss_fuzz_dir
+    return setup_local_fuzzing(
+        project_name,
+        output_dir=output_dir,
+        architecture=architecture,
+        sanitizer=sanitizer
+    )
+
+
 def run_local_fuzzing(project_name: str,
                      fuzz_target: str,
                      corpus_dir: Optional[str] = None,
                      duration: int = 60,
                      max_memory: Optional[int] = None,
                      env_vars: Optional[Dict[str, str]] = None,
-                     output_dir: Optional[str] = None) -> FuzzingExecution:
+                     output_dir: Optional[str] = None,
+                     parallel: int = 1,
+                     jobs: Optional[int] = None,
+                     execution: Optional[FuzzingExecution] = None) -> FuzzingExecution:
     """
     Run a local fuzzing session for an OSS-Fuzz project.
     
+    The statistics are simulated: `executions` is estimated from the
+    duration and no crashes are reported. A built fuzz target is started,
+    and instances that exit with a non-zero status are noted in `warning`;
+    their output is in fuzz-<index>.log in the output directory. The
+    placeholder target written by setup_local_fuzzing is not run.
+    
     Args:
         project_name (str): Name of the OSS-Fuzz project
         fuzz_target (str): Name of the fuzz target to run
@@ -92,13 +227,20 @@ def run_local_fuzzing(project_name: str,
         max_memory (int, optional): Maximum memory in MB
         env_vars (Dict, optional): Additional environment variables
         output_dir (str, optional): Directory to save fuzzing results
+        parallel (int, optional): Number of fuzzer instances to run concurrently (default: 1)
+        jobs (int, optional): Total number of fuzzer instances to run, like
+            libFuzzer's -jobs; `parallel` plays the role of -workers (default: parallel)
+        execution (FuzzingExecution, optional): Session returned by an earlier
+            setup_local_fuzzing call; when given, setup is not repeated and
+            `fuzz_target` and `output_dir` are ignored
         
     Returns:
         FuzzingExecution: The fuzzing execution session
         
     Raises:
         ValueError: If parameters are invalid
-        RuntimeError: If fuzzing fails
+        RuntimeError: If called from a running event loop; use
+            run_local_fuzzing_async there instead
         
     Example:
         >>> execution = run_local_fuzzing("curl", "curl_fuzzer", 
@@ -107,14 +249,76 @@ def run_local_fuzzing(project_name: str,
         >>> print(f"Executions: {execution.executions}, Crashes: {execution.crashes}")
         Executions: 1000000, Crashes: 0
     """
-    project_name = validate_project_name(project_name)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        # Blocking here would stall the caller's loop for the whole session
+        raise RuntimeError(
+            "run_local_fuzzing cannot be called from a running event loop; "
+            "await run_local_fuzzing_async instead"
+        )
     
-    # Set up the fuzzing environment
-    execution = setup_local_fuzzing(
+    return asyncio.run(run_local_fuzzing_async(
         project_name=project_name,
         fuzz_target=fuzz_target,
-        output_dir=output_dir
-    )
+        corpus_dir=corpus_dir,
+        duration=duration,
+        max_memory=max_memory,
+        env_vars=env_vars,
+        output_dir=output_dir,
+        parallel=parallel,
+        jobs=jobs,
+        execution=execution
+    ))
+
+
+async def run_local_fuzzing_async(project_name: str,
+                                  fuzz_target: str,
+                                  corpus_dir: Optional[str] = None,
+                                  duration: int = 60,
+                                  max_memory: Optional[int] = None,
+                                  env_vars: Optional[Dict[str, str]] = None,
+                                  output_dir: Optional[str] = None,
+                                  parallel: int = 1,
+                                  jobs: Optional[int] = None,
+                                  execution: Optional[FuzzingExecution] = None) -> FuzzingExecution:
+    """
+    Run a local fuzzing session for an OSS-Fuzz project from an event loop.
+    
+    Takes the same arguments as run_local_fuzzing. All fuzzer instances are
+    supervised from the running loop, so waiting on many child processes
+    does not cost a thread per child. If the coroutine is cancelled, the
+    instances already started are terminated.
+    
+    Returns:
+        FuzzingExecution: The fuzzing execution session
+        
+    Raises:
+        ValueError: If parameters are invalid
+        
+    Example:
+        >>> execution = await run_local_fuzzing_async("curl", "curl_fuzzer", duration=300)
+        >>> print(f"Executions: {execution.executions}, Crashes: {execution.crashes}")
+        Executions: 300000, Crashes: 0
+    """
+    project_name = validate_project_name(project_name)
+    
+    if parallel < 1:
+        raise ValueError("parallel must be a positive integer")
+    if jobs is None:
+        jobs = parallel
+    elif jobs < 1:
+        raise ValueError("jobs must be a positive integer")
+    
+    # Set up the fuzzing environment unless the caller already did
+    if execution is None:
+        execution = setup_local_fuzzing(
+            project_name=project_name,
+            fuzz_target=fuzz_target,
+            output_dir=output_dir
+        )
     
     # Update execution parameters
     if corpus_dir:
@@ -125,35 +329,121 @@ def run_local_fuzzing(project_name: str,
         execution.environment_vars.update(env_vars)
     
     try:
+        # Every instance runs the same libFuzzer command line over the shared corpus
+        command = [
+            str(execution.output_dir / execution.target.name),
+            f"-max_total_time={duration}",
+            f"-artifact_prefix={execution.output_dir}{os.sep}",
+        ]
+        if execution.max_memory:
+            command.append(f"-rss_limit_mb={execution.max_memory}")
+        
+        # Instances share one corpus directory, which libFuzzer reloads
+        # periodically, so every input is stored once rather than copied per
+        # instance. Without a caller-supplied corpus, use one in the output
+        # directory so new inputs are kept and shared.
+        if not execution.corpus_dir:
+            execution.corpus_dir = execution.output_dir / "corpus"
+            execution.corpus_dir.mkdir(exist_ok=True)
+        command.append(str(execution.corpus_dir))
+        
+        # The placeholder written by setup is not a fuzzer and may not even
+        # be runnable here, so it is never started
+        if _is_placeholder_target(execution.output_dir / execution.target.name):
+            return_codes = [0] * jobs
+        else:
+            return_codes = await _supervise_fuzzers(
+                [command] * jobs,
+                parallel=parallel,
+                env={**os.environ, **execution.environment_vars},
+                log_dir=execution.output_dir
+            )
+        
         # For demonstration purposes, since we can't actually run fuzzing
         execution.warning = "This is a simulated fuzzing run. Actual fuzzing requires proper setup."
-        execution.executions = int(duration * 1000)  # Simulate executions
+        failed = sum(1 for code in return_codes if code != 0)
+        if failed:
+            execution.warning += (
+                f" {failed} of {jobs} fuzzer instances exited with a non-zero status;"
+                f" see the fuzz-<index>.log files in {execution.output_dir}."
+            )
+        execution.executions = int(duration * 1000) * jobs  # Simulate executions
         execution.crashes = 0
         execution.unique_crashes = 0
         execution.run_time = float(duration)
+        execution.duration = duration
+        execution.end_time = execution.start_time + datetime.timedelta(seconds=duration)
         execution.status = "completed"
         
         # Create some sample output files
         if execution.output_dir:
-            with open(execution.output_dir / "fuzzing_stats.json", 'w') as f:
-                json.dump({
-                    'start_time': execution.start_time.isoformat(),
-                    'end_time': execution.end_time.isoformat(),
-                    'executions': execution.executions,
-                    'crashes': execution.crashes,
-                    'unique_crashes': execution.unique_crashes,
-                    'peak_rss': 100 * 1024 * 1024,  # 100 MB
-                    'average_exec_per_sec': execution.executions / duration
-                }, f, indent=2)
+            (execution.output_dir / "fuzzing_stats.json").write_bytes(_dumps_stats({
+                'start_time': execution.start_time.isoformat(),
+                'end_time': execution.end_time.isoformat(),
+                'executions': execution.executions,
+                'crashes': execution.crashes,
+                'unique_crashes': execution.unique_crashes,
+                'peak_rss': 100 * 1024 * 1024,  # 100 MB
+                'average_exec_per_sec': execution.executions / duration
+            }))
                 
     except Exception as e:
         execution.status = "failed"
         execution.error = str(e)
-        logger.error(f"Failed to run local fuzzing: {e}")
+        logger.error("Failed to run local fuzzing: %s", e)
     
     return execution
 
 
+async def _supervise_fuzzers(commands: Sequence[List[str]],
+                             parallel: int,
+                             env: Dict[str, str],
+                             log_dir: Path) -> List[int]:
+    """
+    Run fuzzer processes concurrently, at most `parallel` at a time.
+    
+    Each instance writes its output to fuzz-<index>.log in `log_dir`, like
+    libFuzzer's own -jobs mode, so no pipe needs draining while it runs.
+    
+    Args:
+        commands (Sequence[List[str]]): Command line for each instance
+        parallel (int): Maximum number of instances running at once
+        env (Dict[str, str]): Environment for the child processes
+        log_dir (Path): Directory for the per-instance logs
+        
+    Returns:
+        List[int]: Exit code of each instance, in command order
+    """
+    semaphore = asyncio.Semaphore(parallel)
+    started: List[asyncio.subprocess.Process] = []
+    
+    async def _run_one(index: int, command: List[str]) -> int:
+        async with semaphore:
+            with open(log_dir / f"fuzz-{index}.log", 'wb') as log:
+                proc = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=log,
+                    stderr=asyncio.subprocess.STDOUT,
+                    env=env
+                )
+                started.append(proc)
+                return await proc.wait()
+    
+    try:
+        return await asyncio.gather(*[_run_one(i, c) for i, c in enumerate(commands)])
+    finally:
+        # If an instance failed to start or the caller cancelled, stop the
+        # ones still running rather than leaving them orphaned
+        for proc in started:
+            if proc.returncode is None:
+                try:
+                    proc.terminate()
+                except ProcessLookupError:
+                    pass
+        for proc in started:
+            await proc.wait()
+
+
 def analyze_fuzzing_results(results_dir: str) -> Dict[str, Any]:
     """
     Analyze the results of a fuzzing session.
@@ -178,7 +468,8 @@ def analyze_fuzzing_results(results_dir: str) -> Dict[str, Any]:
             'coverage': {...}
         }
     """
-    if not results_dir or not os.path.exists(results_dir):
+    results_path = Path(results_dir) if results_dir else None
+    if not results_path or not results_path.is_dir():
         raise ValueError(f"Results directory not found: {results_dir}")
     
     result = {
@@ -186,17 +477,19 @@ def analyze_fuzzing_results(results_dir: str) -> Dict[str, Any]:
     }
     
     try:
-        # Look for statistics file
-        stats_file = os.path.join(results_dir, "fuzzing_stats.json")
-        if os.path.exists(stats_file):
-            with open(stats_file, 'r') as f:
-                stats = json.load(f)
-                result.update(stats)
+        # Look for statistics file; opening it directly avoids a separate existence check
+        try:
+            result.update(_loads_stats((results_path / "fuzzing_stats.json").read_bytes()))
+        except FileNotFoundError:
+            pass
         
         # Look for crash files
-        crash_dir = os.path.join(results_dir, "crashes")
-        if os.path.exists(crash_dir):
-            crashes = [f for f in os.listdir(crash_dir) if os.path.isfile(os.path.join(crash_dir, f))]
+        try:
+            with os.scandir(results_path / "crashes") as entries:
+                crashes = [entry.name for entry in entries if entry.is_file()]
+        except FileNotFoundError:
+            pass
+        else:
             result['crash_files'] = crashes
             result['crash_count'] = len(crashes)
         
@@ -204,7 +497,7 @@ def analyze_fuzzing_results(results_dir: str) -> Dict[str, Any]:
         
     except Exception as e:
         result['error'] = str(e)
-        logger.error(f"Failed to analyze fuzzing results: {e}")
+        logger.error("Failed to analyze fuzzing results: %s", e)
     
     return result
 
@@ -243,22 +536,24 @@ def collect_coverage(project_name: str,
     """
     project_name = validate_project_name(project_name)
     
-    if not fuzz_target or not os.path.exists(fuzz_target):
+    fuzz_target_path = Path(fuzz_target) if fuzz_target else None
+    if not fuzz_target_path or not fuzz_target_path.exists():
         raise ValueError(f"Fuzz target binary not found: {fuzz_target}")
     
-    if not corpus_dir or not os.path.exists(corpus_dir):
+    corpus_path = Path(corpus_dir) if corpus_dir else None
+    if not corpus_path or not corpus_path.is_dir():
         raise ValueError(f"Corpus directory not found: {corpus_dir}")
     
     # Create a temporary directory if none provided
-    if not output_dir:
-        output_dir = os.path.join(os.getcwd(), f"{project_name}_coverage")
+    output_path = Path(output_dir) if output_dir else Path.cwd() / f"{project_name}_coverage"
+    output_dir = str(output_path)
     
     # Create the output directory
-    os.makedirs(output_dir, exist_ok=True)
+    output_path.mkdir(parents=True, exist_ok=True)
     
     result = {
         'project': project_name,
-        'fuzz_target': os.path.basename(fuzz_target),
+        'fuzz_target': fuzz_target_path.name,
         'fuzz_target_path': fuzz_target,
         'corpus_dir': corpus_dir,
         'output_dir': output_dir,
@@ -267,70 +562,30 @@ def collect_coverage(project_name: str,
     
     try:
         # Count corpus files
-        corpus_files = [f for f in os.listdir(corpus_dir) if os.path.isfile(os.path.join(corpus_dir, f))]
-        result['corpus_files'] = len(corpus_files)
-        
-        # For demonstration purposes, since we can't actually run coverage
-        result['warning'] = "This is a simulated coverage run. Actual coverage requires proper setup."
-        result['line_coverage'] = 75.5
-        result['function_coverage'] = 82.3
-        result['branch_coverage'] = 68.7
+        with os.scandir(corpus_path) as entries:
+            corpus_files = sum(1 for entry in entries if entry.is_file())
         
         # Create a sample report file
-        report_path = os.path.join(output_dir, "coverage_report.html")
-        with open(report_path, 'w') as f:
-            f.write("<html><body><h1>Sample Coverage Report</h1></body></html>")
+        report_path = output_path / "coverage_report.html"
+        fd = os.open(report_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, _PLACEHOLDER_COVERAGE_REPORT)
+        finally:
+            os.close(fd)
         
-        result['report_path'] = report_path
-        result['success'] = True
+        # For demonstration purposes, since we can't actually run coverage
+        result.update(
+            corpus_files=corpus_files,
+            warning="This is a simulated coverage run. Actual coverage requires proper setup.",
+            line_coverage=75.5,
+            function_coverage=82.3,
+            branch_coverage=68.7,
+            report_path=str(report_path),
+            success=True
+        )
         
     except Exception as e:
         result['error'] = str(e)
-        logger.error(f"Failed to collect coverage: {e}")
+        logger.error("Failed to collect coverage: %s", e)
     
     return result
-
-
-def _get_fuzz_targets(project_name: str, project_dir: str) -> List[str]:
-    """
-    Get available fuzz targets for a project.
-    
-    Args:
-        project_name (str): Name of the OSS-Fuzz project
-        project_dir (str): Path to the project directory in OSS-Fuzz
-        
-    Returns:
-        List[str]: List of available fuzz targets
-    """
-    targets = []
-    
-    # Try to find targets from build.sh
-    build_script = os.path.join(project_dir, "build.sh")
-    if os.path.exists(build_script):
-        try:
-            with open(build_script, 'r') as f:
-                content = f.read()
-                # Look for compilation of fuzz targets (common patterns)
-                fuzz_patterns = [
-                    r'\$CXX.*\$CXXFLAGS.*\$LIB_FUZZING_ENGINE.*-o\s+(\$OUT/[\w_-]+)',
-                    r'cp\s+[\w_-]+\s+(\$OUT/[\w_-]+)',
-                    r'compile_go_fuzzer\s+[\w\./]+\s+([\w_-]+)',
-                    r'compile_rust_fuzzer\s+[\w\./]+\s+([\w_-]+)'
-                ]
-                
-                for pattern in fuzz_patterns:
-                    matches = re.findall(pattern, content)
-                    for match in matches:
-                        # Extract just the filename from paths like $OUT/fuzzer_name
-                        target = os.path.basename(match.replace('$OUT/', ''))
-                        if target and target not in targets:
-                            targets.append(target)
-        except Exception as e:
-            logger.warning(f"Failed to parse build script for {project_name}: {e}")
-    
-    # If no targets found, provide some common naming patterns
-    if not targets:
-        # Common naming pattern: project_fuzzer
-        targets.append(f"{project_name}_fuzzer")
-    
-    return targets 
\ No newline at end of file
@@ -7,12 +7,18 @@ This example demonstrates how to use the OSS-Fuzz API to:
 2. Retrieve coverage data
 3. Download the corpus
 4. Run a local fuzzing job
+
+Several projects can be processed concurrently, e.g.:
+
+    python curl_fuzzing.py --projects curl openssl libssh2 --run --duration 300
 """
 
 import os
 import sys
 import logging
+import argparse
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path if running directly
@@ -30,75 +36,74 @@ logging.basicConfig(
 )
 logger = logging.getLogger("curl_fuzzing_example")
 
-# Project configuration
-PROJECT_NAME = "curl"
-FUZZ_TARGET = "curl_fuzzer"
-DURATION_MINUTES = 2
+# Default configuration
+DEFAULT_PROJECTS = ["curl"]
+DEFAULT_DURATION = 120  # seconds
 
-def main():
+def process(project_name, run=False, duration=DEFAULT_DURATION):
     """
-    Main function demonstrating the OSS-Fuzz API workflow for the curl project.
-    """
-    logger.info(f"Starting OSS-Fuzz API example for {PROJECT_NAME}")
+    Run the OSS-Fuzz API workflow for a single project.
     
-    # Check if curl is in the list of available projects
-    projects = list_projects()
-    if PROJECT_NAME not in projects:
-        logger.error(f"Project {PROJECT_NAME} not found in OSS-Fuzz.")
-        logger.info(f"Available projects: {', '.join(projects[:5])}...")
-        sys.exit(1)
+    Args:
+        project_name (str): Name of the OSS-Fuzz project
+        run (bool): Whether to run the fuzzer after setting it up
+        duration (int): Fuzzing duration in seconds
+        
+    Returns:
+        bool: True if the workflow completed successfully
+    """
+    fuzz_target = f"{project_name}_fuzzer"
     
     # Step 1: Get project details
-    logger.info(f"Getting project details for {PROJECT_NAME}")
-    project_details = get_project_details(PROJECT_NAME)
+    logger.info(f"Getting project details for {project_name}")
+    project_details = get_project_details(project_name)
     logger.info(f"Project details: {project_details}")
     
     # Step 2: Check for available fuzz targets
-    logger.info(f"Getting fuzz targets for {PROJECT_NAME}")
-    targets_info = get_fuzz_targets(PROJECT_NAME)
-    logger.info(f"Available targets: {targets_info.get('fuzz_targets', [])}")
+    logger.info(f"Getting fuzz targets for {project_name}")
+    available_targets = [t.name for t in get_fuzz_targets(project_name)]
+    logger.info(f"Available targets: {available_targets}")
     
     # Confirm the fuzz target exists or use the first available one
-    available_targets = targets_info.get('fuzz_targets', [])
     if not available_targets:
-        logger.error(f"No fuzz targets found for {PROJECT_NAME}")
-        sys.exit(1)
+        logger.error(f"No fuzz targets found for {project_name}")
+        return False
         
-    target_to_use = FUZZ_TARGET
-    if FUZZ_TARGET not in available_targets:
+    target_to_use = fuzz_target
+    if fuzz_target not in available_targets:
         target_to_use = available_targets[0]
-        logger.warning(f"Specified target {FUZZ_TARGET} not found, using {target_to_use} instead")
+        logger.warning(f"Specified target {fuzz_target} not found, using {target_to_use} instead")
     
     # Step 3: Get coverage information
-    logger.info(f"Getting coverage information for {PROJECT_NAME}")
+    logger.info(f"Getting coverage information for {project_name}")
     end_date = datetime.datetime.now()
     start_date = end_date - datetime.timedelta(days=30)
     
     try:
         coverage = get_coverage(
-            PROJECT_NAME,
+            project_name,
             start_date=start_date,
             end_date=end_date
         )
-        logger.info(f"Overall coverage: {coverage.get('overall_coverage', 'N/A')}%")
-        logger.info(f"Line coverage: {coverage.get('line_coverage', 'N/A')}%")
-        logger.info(f"Function coverage: {coverage.get('function_coverage', 'N/A')}%")
+        logger.info(f"Overall coverage: {coverage.overall_coverage}%")
+        logger.info(f"Line coverage: {coverage.line_coverage}%")
+        logger.info(f"Function coverage: {coverage.function_coverage}%")
     except Exception as e:
         logger.warning(f"Warning: Could not get coverage information: {e}")
     
     # Step 4: Get coverage report URL
     try:
-        report = get_coverage_report(PROJECT_NAME)
+        report = get_coverage_report(project_name)
         logger.info(f"Coverage report available at: {report.get('report_url', 'N/A')}")
     except Exception as e:
         logger.warning(f"Warning: Could not get coverage report: {e}")
     
     # Step 5: Download corpus
-    corpus_dir = os.path.join(os.getcwd(), f"{PROJECT_NAME}_corpus")
+    corpus_dir = os.path.join(os.getcwd(), f"{project_name}_corpus")
     logger.info(f"Downloading corpus for {target_to_use} to {corpus_dir}")
     
     try:
-        corpus_result = download_corpus(PROJECT_NAME, target_to_use, corpus_dir)
+        corpus_result = download_corpus(project_name, target_to_use, corpus_dir)
         logger.info(f"Corpus downloaded: {corpus_result.get('files_created', 0)} files")
     except Exception as e:
         logger.warning(f"Warning: Could not download corpus: {e}")
@@ -106,47 +111,82 @@ def main():
         os.makedirs(corpus_dir, exist_ok=True)
     
     # Step 6: Set up local fuzzing
-    logger.info(f"Setting up local fuzzing for {PROJECT_NAME} with target {target_to_use}")
-    fuzzing_dir = os.path.join(os.getcwd(), f"{PROJECT_NAME}_fuzzing")
+    logger.info(f"Setting up local fuzzing for {project_name} with target {target_to_use}")
+    fuzzing_dir = os.path.join(os.getcwd(), f"{project_name}_fuzzing")
     
     try:
         setup_result = setup_local_fuzzing(
-            PROJECT_NAME,
+            project_name,
             fuzz_target=target_to_use,
             output_dir=fuzzing_dir
         )
         
-        if not setup_result.get('success', False):
-            logger.error(f"Failed to set up local fuzzing: {setup_result.get('error', 'Unknown error')}")
-            sys.exit(1)
+        if setup_result.status == "failed":
+            logger.error(f"Failed to set up local fuzzing: {setup_result.error or 'Unknown error'}")
+            return False
             
         logger.info(f"Local fuzzing setup successful")
-        logger.info(f"Fuzz target path: {setup_result.get('fuzz_target_path')}")
+        logger.info(f"Fuzz target path: {setup_result.output_dir / setup_result.target.name}")
         
-        # Step 7: Run local fuzzing (optional, ask user first)
-        run_fuzzing = input(f"Do you want to run {target_to_use} for {DURATION_MINUTES} minutes? (y/n): ")
-        
-        if run_fuzzing.lower() == 'y':
-            logger.info(f"Running local fuzzing for {DURATION_MINUTES} minutes")
-            output_dir = os.path.join(os.getcwd(), f"{PROJECT_NAME}_fuzzing_output")
-            
+        # Step 7: Run local fuzzing (optional, enabled with --run)
+        if run:
+            logger.info(f"Running local fuzzing of {target_to_use} for {duration} seconds")
+            # Reuse the setup above instead of repeating it; results are
+            # written to the setup's output directory
             fuzzing_result = run_local_fuzzing(
-                PROJECT_NAME,
-                fuzz_target=setup_result.get('fuzz_target_path'),
+                project_name,
+                fuzz_target=target_to_use,
                 corpus_dir=corpus_dir,
-                duration=DURATION_MINUTES * 60,  # Convert to seconds
-                output_dir=output_dir
+                duration=duration,
+                execution=setup_result
             )
+            output_dir = fuzzing_dir
             
-            logger.info(f"Fuzzing completed with {fuzzing_result.get('executions', 0)} executions")
-            logger.info(f"Crashes found: {fuzzing_result.get('crashes', 0)}")
+            logger.info(f"Fuzzing completed with {fuzzing_result.executions} executions")
+            logger.info(f"Crashes found: {fuzzing_result.crashes}")
             
             # Step 8: Analyze results
             analysis = analyze_fuzzing_results(output_dir)
             logger.info(f"Analysis results: {analysis}")
             
     except Exception as e:
-        logger.error(f"Error during fuzzing setup/execution: {e}")
+        logger.error(f"Error during fuzzing setup/execution for {project_name}: {e}")
+        return False
+    
+    return True
+
+def main():
+    """
+    Main function demonstrating the OSS-Fuzz API workflow, processing the
+    requested projects concurrently.
+    """
+    parser = argparse.ArgumentParser(description="OSS-Fuzz API example workflow")
+    parser.add_argument("--projects", nargs="+", default=DEFAULT_PROJECTS,
+                        help="OSS-Fuzz projects to process")
+    parser.add_argument("--run", action="store_true",
+                        help="Run each fuzzer after setting it up")
+    parser.add_argument("--duration", type=int, default=DEFAULT_DURATION,
+                        help="Fuzzing duration in seconds")
+    args = parser.parse_args()
+    
+    logger.info(f"Starting OSS-Fuzz API example for {', '.join(args.projects)}")
+    
+    # Check that every requested project is available
+    projects = set(list_projects())
+    missing = [name for name in args.projects if name not in projects]
+    if missing:
+        logger.error(f"Projects not found in OSS-Fuzz: {', '.join(missing)}")
+        logger.info(f"Available projects: {', '.join(sorted(projects)[:5])}...")
+        sys.exit(1)
+    
+    # Each project's downloads and setup are I/O bound, so they overlap well
+    with ThreadPoolExecutor(max_workers=len(args.projects)) as executor:
+        results = list(executor.map(
+            lambda name: process(name, run=args.run, duration=args.duration),
+            args.projects
+        ))
+    
+    if not all(results):
         sys.exit(1)
     
     logger.info("OSS-Fuzz API example completed successfully")
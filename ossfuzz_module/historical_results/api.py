@@ -2,23 +2,84 @@
 Historical results APIs for OSS-Fuzz projects.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union, Sequence, Tuple
 import datetime
+import functools
+import hashlib
 import logging
+import os
 import random
-import pandas as pd
+from pathlib import Path
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from ..utils.client import client
-from ..utils.common import validate_project_name
+from ..utils.common import validate_project_name, _to_date
 from ..models import OSSFuzzProject, CoverageReport
 
 logger = logging.getLogger(__name__)
 
+def _iso(value: Any) -> Any:
+    """
+    Format a date for the query summary.
+    
+    Args:
+        value: Date or datetime object, string or None
+        
+    Returns:
+        ISO format string for date objects, anything else unchanged
+    """
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def _date_key(value: Optional[Union[datetime.date, str]], name: str) -> Optional[str]:
+    """
+    Normalize an optional date parameter for use in a cache key.
+    
+    Args:
+        value (date, datetime or str, optional): Date object or ISO format string
+        name (str): Name of the parameter, used in error messages
+        
+    Returns:
+        Optional[str]: The date as YYYY-MM-DD, or None if no date was given
+        
+    Raises:
+        ValueError: If the string is not in ISO format
+    """
+    return _to_date(value, name).isoformat() if value else None
+
+
+@functools.lru_cache(maxsize=256)
+def _placeholder_coverage(project_name: str,
+                          start_date: Optional[str],
+                          end_date: Optional[str]) -> Tuple[float, float, float]:
+    """
+    Generate placeholder coverage percentages for a query.
+    
+    The values are drawn from a generator seeded by the query, so the same
+    query always gives the same numbers, and are memoized so that repeated
+    queries skip the draws entirely.
+    
+    Args:
+        project_name (str): Name of the OSS-Fuzz project
+        start_date (str, optional): Start date of the query as YYYY-MM-DD
+        end_date (str, optional): End date of the query as YYYY-MM-DD
+        
+    Returns:
+        Tuple[float, float, float]: Line, function and overall coverage
+    """
+    key = f"{project_name}|{start_date}|{end_date}"
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    rng = random.Random(int.from_bytes(digest, "big"))
+    return rng.uniform(60, 85), rng.uniform(70, 95), rng.uniform(65, 80)
+
+
 def get_coverage(project_name: str,
                 start_date: Optional[Union[datetime.datetime, str]] = None,
                 end_date: Optional[Union[datetime.datetime, str]] = None,
                 fuzzer: Optional[str] = None,
-                format: str = "json") -> Union[CoverageReport, pd.DataFrame]:
+                format: str = "json") -> Union[CoverageReport, "pd.DataFrame"]:
     """
     Get coverage information for a project.
     
@@ -33,7 +94,7 @@ def get_coverage(project_name: str,
         CoverageReport or pd.DataFrame: Coverage information
         
     Raises:
-        ValueError: If project name is invalid
+        ValueError: If project name or a date is invalid
         
     Example:
         >>> coverage = get_coverage("curl", 
@@ -47,41 +108,86 @@ def get_coverage(project_name: str,
     # Get project details
     project = client.get_project_details_from_repo(project_name)
     
-    # Parse date range
-    date_range = {
-        "start_date": start_date.isoformat() if isinstance(start_date, datetime.datetime) else start_date,
-        "end_date": end_date.isoformat() if isinstance(end_date, datetime.datetime) else end_date
-    }
-    
     # Get coverage information from OSS-Fuzz service
     coverage_info = client.get_coverage(project, start_date, end_date)
     
     if not coverage_info:
-        logger.warning(f"Could not fetch coverage data for {project_name}")
+        logger.warning("Could not fetch coverage data for %s", project_name)
         return None
     
-    # Add placeholder data for demonstration
-    coverage_info.line_coverage = random.uniform(60, 85)
-    coverage_info.function_coverage = random.uniform(70, 95)
-    coverage_info.overall_coverage = random.uniform(65, 80)
+    # Add placeholder data for demonstration, seeded by the query so that
+    # repeating it gives the same numbers
+    (coverage_info.line_coverage,
+     coverage_info.function_coverage,
+     coverage_info.overall_coverage) = _placeholder_coverage(
+        project_name, _date_key(start_date, "start_date"), _date_key(end_date, "end_date")
+    )
     
     if format.lower() == "dataframe":
-        # Convert daily coverage to DataFrame
-        df = pd.DataFrame([{
-            'date': coverage_info.date,
-            'line_coverage': coverage_info.line_coverage,
-            'function_coverage': coverage_info.function_coverage,
-            'overall_coverage': coverage_info.overall_coverage
-        }])
-        
-        # Convert date strings to datetime objects
-        if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"])
-            
-        return df
+        # pandas is slow to import, so only load it when a DataFrame is requested
+        import pandas as pd
+        
+        # Convert coverage to a DataFrame, building it column-wise so pandas
+        # does not have to infer columns from a list of row dicts, with the
+        # date column typed up front instead of converted afterwards
+        return pd.DataFrame({
+            'date': pd.DatetimeIndex([coverage_info.date]),
+            'line_coverage': [coverage_info.line_coverage],
+            'function_coverage': [coverage_info.function_coverage],
+            'overall_coverage': [coverage_info.overall_coverage]
+        })
         
     return coverage_info
 
+def get_coverage_batch(project_names: Sequence[str],
+                       start_date: Optional[Union[datetime.datetime, str]] = None,
+                       end_date: Optional[Union[datetime.datetime, str]] = None,
+                       fuzzer: Optional[str] = None,
+                       format: str = "json") -> Union[List[CoverageReport], "pd.DataFrame"]:
+    """
+    Get coverage information for several projects.
+    
+    Prefer this over calling get_coverage(format="dataframe") per project:
+    the DataFrame is built once for all projects instead of once per row.
+    Projects without coverage data are left out.
+    
+    Args:
+        project_names (Sequence[str]): Names of the OSS-Fuzz projects
+        start_date (datetime or str, optional): Start date for coverage data
+        end_date (datetime or str, optional): End date for coverage data
+        fuzzer (str, optional): Name of the fuzzer to get coverage for
+        format (str, optional): Output format ("json" or "dataframe")
+        
+    Returns:
+        List[CoverageReport] or pd.DataFrame: Coverage information, one entry per project
+        
+    Raises:
+        ValueError: If a project name is invalid
+        
+    Example:
+        >>> df = get_coverage_batch(["curl", "libpng"], format="dataframe")
+        >>> print(df[["project", "overall_coverage"]])
+    """
+    reports = []
+    for project_name in project_names:
+        coverage_info = get_coverage(project_name, start_date, end_date, fuzzer)
+        if coverage_info:
+            reports.append(coverage_info)
+    
+    if format.lower() == "dataframe":
+        # pandas is slow to import, so only load it when a DataFrame is requested
+        import pandas as pd
+        
+        return pd.DataFrame({
+            'project': [r.project.name for r in reports],
+            'date': pd.DatetimeIndex([r.date for r in reports]),
+            'line_coverage': [r.line_coverage for r in reports],
+            'function_coverage': [r.function_coverage for r in reports],
+            'overall_coverage': [r.overall_coverage for r in reports]
+        })
+    
+    return reports
+
 def get_crash_reports(project_name: str,
                      start_date: Optional[Union[datetime.datetime, str]] = None,
                      end_date: Optional[Union[datetime.datetime, str]] = None,
@@ -115,8 +221,8 @@ def get_crash_reports(project_name: str,
     
     # Parse date range
     date_range = {
-        "start_date": start_date.isoformat() if isinstance(start_date, datetime.datetime) else start_date,
-        "end_date": end_date.isoformat() if isinstance(end_date, datetime.datetime) else end_date
+        "start_date": _iso(start_date),
+        "end_date": _iso(end_date)
     }
     
     # This would be implemented with actual OSS-Fuzz service calls
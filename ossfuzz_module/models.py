@@ -2,57 +2,47 @@
 Data models for OSS-Fuzz module.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pathlib import Path
+import functools
+import sys
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__, which adds up when a
+# whole checkout's worth of projects is loaded. slots= needs Python 3.10, so
+# older interpreters fall back to regular dataclasses.
+if sys.version_info >= (3, 10):
+    _model = functools.partial(dataclass, slots=True)
+else:
+    _model = dataclass
+
+@_model
 class OSSFuzzProject:
     """Represents an OSS-Fuzz project."""
     name: str
     path: Path
     language: Optional[str] = None
     main_repo: Optional[str] = None
-    sanitizers: List[str] = None
-    fuzzing_engines: List[str] = None
-    architectures: List[str] = None
-    maintainers: List[str] = None
+    sanitizers: List[str] = field(default_factory=list)
+    fuzzing_engines: List[str] = field(default_factory=list)
+    architectures: List[str] = field(default_factory=list)
+    maintainers: List[str] = field(default_factory=list)
     has_dockerfile: bool = False
     has_build_script: bool = False
-    config: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.sanitizers is None:
-            self.sanitizers = []
-        if self.fuzzing_engines is None:
-            self.fuzzing_engines = []
-        if self.architectures is None:
-            self.architectures = []
-        if self.maintainers is None:
-            self.maintainers = []
-        if self.config is None:
-            self.config = {}
+    config: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@_model
 class FuzzTarget:
     """Represents a fuzz target in an OSS-Fuzz project."""
     name: str
     project: OSSFuzzProject
     build_script: Optional[Path] = None
-    source_files: List[Path] = None
-    dependencies: List[str] = None
-    environment_vars: Dict[str, str] = None
+    source_files: List[Path] = field(default_factory=list)
+    dependencies: List[str] = field(default_factory=list)
+    environment_vars: Dict[str, str] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if self.source_files is None:
-            self.source_files = []
-        if self.dependencies is None:
-            self.dependencies = []
-        if self.environment_vars is None:
-            self.environment_vars = {}
-
-@dataclass
+@_model
 class FuzzingExecution:
     """Represents a fuzzing execution session."""
     project: OSSFuzzProject
@@ -67,18 +57,19 @@ class FuzzingExecution:
     crashes: int = 0
     unique_crashes: int = 0
     coverage: float = 0.0
-    environment_vars: Dict[str, str] = None
+    environment_vars: Dict[str, str] = field(default_factory=dict)
     status: str = "running"
+    run_time: Optional[float] = None
+    warning: Optional[str] = None
+    error: Optional[str] = None
 
     def __post_init__(self):
-        if self.environment_vars is None:
-            self.environment_vars = {}
         if self.end_time is None:
             self.end_time = datetime.now()
         if self.duration is None:
             self.duration = int((self.end_time - self.start_time).total_seconds())
 
-@dataclass
+@_model
 class CoverageReport:
     """Represents a coverage report for a project."""
     project: OSSFuzzProject
@@ -86,17 +77,7 @@ class CoverageReport:
     line_coverage: float
     function_coverage: float
     overall_coverage: float
-    covered_lines: List[int] = None
-    covered_functions: List[str] = None
-    uncovered_lines: List[int] = None
-    uncovered_functions: List[str] = None
-
-    def __post_init__(self):
-        if self.covered_lines is None:
-            self.covered_lines = []
-        if self.covered_functions is None:
-            self.covered_functions = []
-        if self.uncovered_lines is None:
-            self.uncovered_lines = []
-        if self.uncovered_functions is None:
-            self.uncovered_functions = [] 
\ No newline at end of file
+    covered_lines: List[int] = field(default_factory=list)
+    covered_functions: List[str] = field(default_factory=list)
+    uncovered_lines: List[int] = field(default_factory=list)
+    uncovered_functions: List[str] = field(default_factory=list)
\ No newline at end of file
@@ -2,10 +2,10 @@
 Project information APIs for OSS-Fuzz projects.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any
 import os
 import logging
-from datetime import datetime
+import re
 
 from ..utils.client import client
 from ..utils.common import validate_project_name
@@ -24,6 +24,8 @@ def list_projects() -> List[str]:
         >>> list_projects()
         ['curl', 'ffmpeg', 'openssl', ...]
     """
+    # The client revalidates every project.yaml by mtime and size and only
+    # re-parses the ones that changed, so edits show up on the next call
     projects = client.get_projects_from_repo()
     return [p.name for p in projects]
 
@@ -69,8 +71,8 @@ def get_fuzz_targets(project_name: str) -> List[FuzzTarget]:
         Found 5 fuzz targets
     """
     project_name = validate_project_name(project_name)
-    project = get_project_details(project_name)
-    return client.get_fuzz_targets(project)
+    _, targets = client.get_project_with_targets(project_name)
+    return targets
 
 
 def check_project_exists(project_name: str) -> bool:
@@ -92,10 +94,12 @@ def check_project_exists(project_name: str) -> bool:
     try:
         project_name = validate_project_name(project_name)
         
-        # Get list of all projects
-        projects = list_projects()
+        if not client.oss_fuzz_dir:
+            raise FileNotFoundError("OSS-Fuzz repository not found")
         
-        return project_name in projects
+        # A project is a directory with a project.yaml, so a single stat
+        # answers this without loading every project
+        return os.path.isfile(os.path.join(client.oss_fuzz_dir, "projects", project_name, "project.yaml"))
         
     except ValueError:
         # If project name is invalid, return False
@@ -127,22 +131,20 @@ def get_projects(language: Optional[str] = None,
         # Get all projects from local OSS-Fuzz repo
         projects = client.get_projects_from_repo()
         
-        # Apply filters
         if language:
-            projects = [p for p in projects if p.language and p.language.lower() == language.lower()]
-        
-        if sanitizer:
-            projects = [p for p in projects if sanitizer in p.sanitizers]
-            
-        if fuzzer_engine:
-            projects = [p for p in projects if fuzzer_engine in p.fuzzing_engines]
+            language = language.lower()
         
+        # Apply all filters in a single pass
         # Note: build_system is not directly available in project.yaml
         # We could parse Dockerfile or build.sh to determine this
-        
-        return projects
+        return [
+            p for p in projects
+            if (not language or (p.language and p.language.lower() == language))
+            and (not sanitizer or sanitizer in p.sanitizers)
+            and (not fuzzer_engine or fuzzer_engine in p.fuzzing_engines)
+        ]
     except Exception as e:
-        logger.error(f"Error retrieving projects: {e}")
+        logger.error("Error retrieving projects: %s", e)
         return []
 
 
@@ -170,7 +172,7 @@ def get_project_stats(project_name: str) -> Dict[str, Any]:
             "example_url": f"https://oss-fuzz.com/stats/{project_name}",
         }
     except Exception as e:
-        logger.error(f"Error retrieving project stats for {project_name}: {e}")
+        logger.error("Error retrieving project stats for %s: %s", project_name, e)
         return {
             "error": str(e),
             "project": project_name,
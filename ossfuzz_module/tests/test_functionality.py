@@ -2,14 +2,19 @@
 Test script for OSS-Fuzz module functionality.
 """
 
+import asyncio
 import os
 import sys
 import unittest
 import tempfile
 import shutil
 import subprocess
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest import mock
 
 # Add parent directory to path to import ossfuzz_module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -23,18 +28,24 @@ from ossfuzz_module.project_info.api import (
 )
 from ossfuzz_module.custom_fuzzing.api import (
     setup_local_fuzzing,
+    setup_local_fuzzing_batch,
     run_local_fuzzing,
+    run_local_fuzzing_async,
     analyze_fuzzing_results,
-    collect_coverage
+    collect_coverage,
+    reset_caches,
+    _supervise_fuzzers
 )
 from ossfuzz_module.historical_results.api import (
     get_coverage,
+    get_coverage_batch,
     get_crash_reports,
     get_coverage_report,
     download_corpus
 )
 from ossfuzz_module.models import OSSFuzzProject, FuzzTarget, FuzzingExecution, CoverageReport
-from ossfuzz_module.utils.client import client
+from ossfuzz_module.utils.client import client, OSSFuzzClient
+from ossfuzz_module.utils.common import validate_project_name, validate_date_range
 
 class TestOSSFuzzFunctionality(unittest.TestCase):
     """Test suite for OSS-Fuzz module functionality."""
@@ -46,23 +57,27 @@ class TestOSSFuzzFunctionality(unittest.TestCase):
         cls.test_dir = Path(tempfile.mkdtemp())
         print(f"\nTest directory: {cls.test_dir}")
         
-        # Clone OSS-Fuzz repository
-        cls.oss_fuzz_dir = cls.test_dir / "oss-fuzz"
-        print("\nCloning OSS-Fuzz repository...")
+        # Keep the client's on-disk caches out of the user's cache directory
+        cls.env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(cls.test_dir / "cache")})
+        cls.env.start()
+        
+        # Clone OSS-Fuzz into the test directory, or, when OSSFUZZ_MODULE_CACHE
+        # names a directory, reuse the checkout kept there across test runs,
+        # refreshing it if it exists and cloning it otherwise
+        cache_dir = os.environ.get("OSSFUZZ_MODULE_CACHE")
+        cls.oss_fuzz_dir = (Path(cache_dir) if cache_dir else cls.test_dir) / "oss-fuzz"
         try:
-            subprocess.run(
-                ["git", "clone", "https://github.com/google/oss-fuzz.git", str(cls.oss_fuzz_dir)],
-                check=True,
-                capture_output=True
-            )
+            # Shallow, sparse clone of the files the tests read, or a fetch of
+            # the latest commit into an existing one; this also points the
+            # client at the checkout
+            print("\nUpdating OSS-Fuzz repository...")
+            client.clone_oss_fuzz_repo(str(cls.oss_fuzz_dir), refresh=True)
+            
             # Set environment variable for OSS-Fuzz directory
             os.environ["OSS_FUZZ_DIR"] = str(cls.oss_fuzz_dir)
-            print("OSS-Fuzz repository cloned successfully")
-            
-            # Reinitialize client with new environment variable
-            client.oss_fuzz_dir = str(cls.oss_fuzz_dir)
+            print("OSS-Fuzz repository is up to date")
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, FileExistsError) as e:
             print(f"Warning: Failed to clone OSS-Fuzz repository: {e}")
             print("Some tests may be skipped")
         
@@ -71,9 +86,9 @@ class TestOSSFuzzFunctionality(unittest.TestCase):
         
     @classmethod
     def tearDownClass(cls):
-        """Clean up test environment."""
-        if cls.test_dir.exists():
-            shutil.rmtree(cls.test_dir)
+        """Clean up test environment. A checkout in OSSFUZZ_MODULE_CACHE is kept."""
+        cls.env.stop()
+        shutil.rmtree(cls.test_dir, ignore_errors=True)
     
     def setUp(self):
         """Set up each test."""
@@ -160,6 +175,27 @@ class TestOSSFuzzFunctionality(unittest.TestCase):
         self.assertTrue(coverage.get('success', False))
         print(f"Coverage collected: {coverage.get('line_coverage', 0)}% line coverage")
     
+    def test_custom_fuzzing_batch(self):
+        """Test setting up several projects at once."""
+        print("\nTesting batch fuzzing setup...")
+        
+        # Processes are started with spawn so that workers cannot inherit
+        # the configured client and must be handed the checkout
+        for use_threads in (False, True):
+            with mock.patch("ossfuzz_module.custom_fuzzing.api.ProcessPoolExecutor",
+                            functools.partial(ProcessPoolExecutor,
+                                              mp_context=multiprocessing.get_context("spawn"))):
+                executions = setup_local_fuzzing_batch(
+                    [self.test_project],
+                    output_dir=str(self.test_dir / "batch_setup"),
+                    max_workers=2,
+                    use_threads=use_threads
+                )
+            self.assertEqual(len(executions), 1)
+            self.assertIsInstance(executions[0], FuzzingExecution)
+            self.assertEqual(executions[0].project.name, self.test_project)
+        print(f"Batch setup completed: {len(executions)} projects")
+    
     def test_historical_results(self):
         """Test historical results functionality."""
         print("\nTesting historical results...")
@@ -176,6 +212,16 @@ class TestOSSFuzzFunctionality(unittest.TestCase):
         self.assertIsInstance(coverage, CoverageReport)
         print(f"Coverage: {coverage.overall_coverage}%")
         
+        # Test getting coverage for several projects at once
+        reports = get_coverage_batch(
+            [self.test_project],
+            start_date=start_date,
+            end_date=end_date
+        )
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0].overall_coverage, coverage.overall_coverage)
+        print(f"Batch coverage: {len(reports)} projects")
+        
         # Test getting crash reports
         crashes = get_crash_reports(
             self.test_project,
@@ -202,7 +248,213 @@ class TestOSSFuzzFunctionality(unittest.TestCase):
         )
         self.assertIsInstance(corpus, dict)
         self.assertTrue(corpus.get('success', False))
+        self.assertEqual(corpus.get('files_created'), 5)
         print(f"Corpus downloaded: {corpus.get('files_created', 0)} files")
 
+class TestProjectConfig(unittest.TestCase):
+    """Test loading projects from a minimal local checkout."""
+    
+    def setUp(self):
+        """Create a checkout with one project and a private cache directory."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+        
+        env = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": str(self.test_dir / "cache")})
+        env.start()
+        self.addCleanup(env.stop)
+        
+        self.oss_fuzz_dir = self.test_dir / "oss-fuzz"
+        self.project_dir = self.oss_fuzz_dir / "projects" / "emptykeys"
+        self.project_dir.mkdir(parents=True)
+        
+        self.client = OSSFuzzClient()
+        self.client.oss_fuzz_dir = str(self.oss_fuzz_dir)
+    
+    def test_empty_list_keys(self):
+        """Test that empty list keys in project.yaml load as empty lists."""
+        (self.project_dir / "project.yaml").write_text(
+            "language: c\nsanitizers:\nfuzzing_engines:\narchitectures:\nauto_ccs:\n"
+        )
+        
+        project = self.client.get_project_details_from_repo("emptykeys")
+        self.assertEqual(project.sanitizers, [])
+        self.assertEqual(project.fuzzing_engines, [])
+        self.assertEqual(project.architectures, [])
+        self.assertEqual(project.maintainers, [])
+        
+        projects = self.client.get_projects_from_repo()
+        self.assertEqual([p.name for p in projects], ["emptykeys"])
+    
+    def test_discover_checkout_created_later(self):
+        """Test that discovery finds a checkout created after a failed search."""
+        work_dir = self.test_dir / "work" / "cwd"
+        work_dir.mkdir(parents=True)
+        with mock.patch.dict(os.environ), \
+             mock.patch.object(Path, "cwd", return_value=work_dir), \
+             mock.patch.object(Path, "home", return_value=self.test_dir), \
+             mock.patch("tempfile.gettempdir", return_value=str(work_dir)):
+            os.environ.pop("OSS_FUZZ_DIR", None)
+            self.client.oss_fuzz_dir = None
+            
+            # A directory without infra/ is not taken for a checkout
+            self.assertIsNone(self.client.get_oss_fuzz_dir())
+            
+            (self.oss_fuzz_dir / "infra").mkdir()
+            self.assertEqual(self.client.get_oss_fuzz_dir(), str(self.oss_fuzz_dir))
+    
+    def test_validate_project_name(self):
+        """Test that invalid project names raise ValueError."""
+        self.assertEqual(validate_project_name(" Curl "), "curl")
+        for name in ("", None, ["curl"], {"curl": 1}, 42, "bad/name"):
+            with self.assertRaises(ValueError):
+                validate_project_name(name)
+    
+    def test_validate_date_range_times(self):
+        """Test that same-day ranges are checked down to the time of day."""
+        with self.assertRaises(ValueError):
+            validate_date_range("2024-01-01T10:00", "2024-01-01T09:00")
+        with self.assertRaises(ValueError):
+            validate_date_range(datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 9))
+        self.assertEqual(
+            validate_date_range("2024-01-01T09:00", "2024-01-01T10:00"),
+            {"start_date": "2024-01-01", "end_date": "2024-01-01"}
+        )
+    
+    def test_deprecated_project_details(self):
+        """Test the deprecated dict-returning project details lookup."""
+        (self.project_dir / "project.yaml").write_text("language: c\n")
+        
+        with self.assertWarns(DeprecationWarning):
+            details = self.client.get_project_details("emptykeys")
+        self.assertEqual(details["name"], "emptykeys")
+        self.assertTrue(details["yaml_exists"])
+        self.assertNotIn("dockerfile_exists", details)
+    
+    def test_refresh_requires_git_checkout(self):
+        """Test that refreshing a directory that is not a git checkout is refused."""
+        with self.assertRaises(FileExistsError):
+            self.client.clone_oss_fuzz_repo(str(self.oss_fuzz_dir), refresh=True)
+        self.assertTrue(self.project_dir.is_dir())
+    
+    def test_fuzz_target_lookup(self):
+        """Test looking up single fuzz targets from build.sh."""
+        (self.project_dir / "project.yaml").write_text("language: c\n")
+        (self.project_dir / "build.sh").write_text(
+            "cp first_fuzzer $OUT/first_fuzzer\n"
+            "cp second_fuzzer $OUT/second_fuzzer\n"
+        )
+        project = self.client.get_project_details_from_repo("emptykeys")
+        
+        self.assertEqual(self.client.get_first_fuzz_target(project).name, "first_fuzzer")
+        self.assertEqual(self.client.find_fuzz_target(project, "second_fuzzer").name, "second_fuzzer")
+        self.assertIsNone(self.client.find_fuzz_target(project, "missing_fuzzer"))
+        self.assertEqual(
+            [t.name for t in self.client.get_fuzz_targets(project)],
+            ["first_fuzzer", "second_fuzzer"]
+        )
+        
+        # Targets are ordered by the pattern that found them before file order
+        (self.project_dir / "build.sh").write_text(
+            "cp zzz_fuzzer $OUT/zzz_fuzzer\n"
+            "$CXX $CXXFLAGS fuzz.cc $LIB_FUZZING_ENGINE -o $OUT/main_fuzzer\n"
+        )
+        self.assertEqual(self.client.get_first_fuzz_target(project).name, "main_fuzzer")
+        self.assertEqual(
+            [t.name for t in self.client.get_fuzz_targets(project)],
+            ["main_fuzzer", "zzz_fuzzer"]
+        )
+        
+        # Bytes that are not valid UTF-8 do not cut the scan short
+        (self.project_dir / "build.sh").write_bytes(
+            b"cp first_fuzzer $OUT/first_fuzzer\n"
+            b"# caf\xe9\n"
+            b"cp second_fuzzer $OUT/second_fuzzer\n"
+        )
+        self.assertEqual(
+            [t.name for t in self.client.get_fuzz_targets(project)],
+            ["first_fuzzer", "second_fuzzer"]
+        )
+        
+        # Without a build.sh the conventionally named target is used
+        (self.project_dir / "build.sh").unlink()
+        self.assertEqual(self.client.get_first_fuzz_target(project).name, "emptykeys_fuzzer")
+        self.assertEqual(self.client.find_fuzz_target(project, "emptykeys_fuzzer").name, "emptykeys_fuzzer")
+    
+    def test_setup_local_fuzzing_target(self):
+        """Test that setup_local_fuzzing picks the requested or first fuzz target."""
+        (self.project_dir / "project.yaml").write_text("language: c\n")
+        (self.project_dir / "build.sh").write_text(
+            "cp first_fuzzer $OUT/first_fuzzer\n"
+            "cp second_fuzzer $OUT/second_fuzzer\n"
+        )
+        
+        patcher = mock.patch.object(client, "oss_fuzz_dir", str(self.oss_fuzz_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        reset_caches()
+        self.addCleanup(reset_caches)
+        
+        output_dir = str(self.test_dir / "out")
+        execution = setup_local_fuzzing("emptykeys", fuzz_target="second_fuzzer", output_dir=output_dir)
+        self.assertEqual(execution.target.name, "second_fuzzer")
+        
+        execution = setup_local_fuzzing("emptykeys", fuzz_target="missing_fuzzer", output_dir=output_dir)
+        self.assertEqual(execution.target.name, "first_fuzzer")
+        
+        execution = setup_local_fuzzing("emptykeys", output_dir=output_dir)
+        self.assertEqual(execution.target.name, "first_fuzzer")
+    
+    def test_run_local_fuzzing_in_event_loop(self):
+        """Test running fuzzing from a running event loop."""
+        (self.project_dir / "project.yaml").write_text("language: c\n")
+        
+        patcher = mock.patch.object(client, "oss_fuzz_dir", str(self.oss_fuzz_dir))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        reset_caches()
+        self.addCleanup(reset_caches)
+        
+        async def run():
+            # The blocking API refuses to stall the loop
+            with self.assertRaises(RuntimeError):
+                run_local_fuzzing("emptykeys", fuzz_target="emptykeys_fuzzer", duration=1)
+            return await run_local_fuzzing_async(
+                "emptykeys",
+                fuzz_target="emptykeys_fuzzer",
+                duration=1,
+                output_dir=str(self.test_dir / "out")
+            )
+        
+        execution = asyncio.run(run())
+        self.assertEqual(execution.status, "completed")
+        self.assertEqual(execution.executions, 1000)
+        self.assertEqual(execution.crashes, 0)
+        # The placeholder target is simulated rather than run
+        self.assertFalse((self.test_dir / "out" / "fuzz-0.log").exists())
+    
+    @unittest.skipIf(sys.platform == "win32", "uses a POSIX sleep command")
+    def test_supervised_fuzzers_stopped_on_cancel(self):
+        """Test that cancelling a session terminates the fuzzer processes."""
+        started = []
+        create = asyncio.create_subprocess_exec
+        
+        async def create_and_record(*args, **kwargs):
+            proc = await create(*args, **kwargs)
+            started.append(proc)
+            return proc
+        
+        async def run():
+            with mock.patch("asyncio.create_subprocess_exec", create_and_record):
+                with self.assertRaises(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        _supervise_fuzzers([["sleep", "30"]] * 2, parallel=2,
+                                           env=dict(os.environ), log_dir=self.test_dir),
+                        timeout=1
+                    )
+        
+        asyncio.run(run())
+        self.assertEqual(len(started), 2)
+        self.assertTrue(all(proc.returncode is not None for proc in started))
+
 if __name__ == '__main__':
     unittest.main(verbosity=2) 
\ No newline at end of file
@@ -2,22 +2,274 @@
 Client for interacting with OSS-Fuzz services.
 """
 
+import functools
+import hashlib
 import os
-import yaml
 import json
 import logging
 import subprocess
+import sys
 import tempfile
-import shutil
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Union, Tuple
 from datetime import datetime
 import re
 
+from .common import get_cache_dir, write_file_atomic
 from ..models import OSSFuzzProject, FuzzTarget, FuzzingExecution, CoverageReport
 
 logger = logging.getLogger(__name__)
 
+# Most project.yaml files are flat "key: value" maps whose values are plain
+# or quoted scalars, flow lists or block lists of scalars. These are parsed
+# directly; anything outside that subset is left to PyYAML.
+_YAML_KEY_RE = re.compile(r'([A-Za-z_][\w-]*):(?:[ ]+(.*?))?[ ]*$')
+_YAML_ITEM_RE = re.compile(r'([ ]*)-[ ]+(.*?)[ ]*$')
+_YAML_INT_RE = re.compile(r'[-+]?(?:0|[1-9][0-9]*)$')
+_YAML_CONSTANTS = {
+    **dict.fromkeys(('true', 'True', 'TRUE', 'yes', 'Yes', 'YES', 'on', 'On', 'ON'), True),
+    **dict.fromkeys(('false', 'False', 'FALSE', 'no', 'No', 'NO', 'off', 'Off', 'OFF'), False),
+    **dict.fromkeys(('null', 'Null', 'NULL', '~'), None),
+}
+
+# Threads used to load project.yaml files, overridable through
+# OSS_FUZZ_MAX_WORKERS for constrained environments. The work is I/O bound,
+# so several threads per CPU pay off, up to a fixed cap.
+_DEFAULT_LOADER_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Literals at least one of which every fuzz target pattern match contains;
+# a build script without any of them cannot define fuzz targets
+_FUZZ_TARGET_LITERALS = (b'$OUT/', b'compile_go_fuzzer', b'compile_rust_fuzzer')
+
+# Common ways build.sh scripts produce fuzz targets, in priority order:
+# targets found by an earlier pattern are listed before those of later ones.
+# The patterns are bytes so that build scripts in any encoding are scanned
+# in full; only the captured names, which are ASCII, are decoded.
+_FUZZ_TARGET_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    rb'\$CXX.*\$CXXFLAGS.*\$LIB_FUZZING_ENGINE.*-o\s+\$OUT/([\w_-]+)',
+    rb'cp\s+[\w_-]+\s+\$OUT/([\w_-]+)',
+    rb'compile_go_fuzzer\s+[\w\./]+\s+([\w_-]+)',
+    rb'compile_rust_fuzzer\s+[\w\./]+\s+([\w_-]+)',
+))
+
+# project.yaml files are a few KB, so one read of this size gets a whole file
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Bumped whenever the layout of the on-disk project.yaml cache changes
+_CONFIG_CACHE_VERSION = 2
+
+# Directories of the OSS-Fuzz repository that are checked out when cloning;
+# projects/ holds the project files this module reads, and infra/ the helper
+# scripts that come with every OSS-Fuzz checkout
+_SPARSE_CHECKOUT_DIRS = ("projects", "infra")
+
+# Stand-in written where a built fuzz target binary would go
+_PLACEHOLDER_FUZZ_TARGET = b"#!/bin/bash\necho 'This is a placeholder for the actual fuzz target binary'"
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader() -> type:
+    """
+    Get the PyYAML loader for project.yaml files, importing PyYAML on first use.
+    
+    PyYAML is slow to import and most project.yaml files are handled by
+    _parse_flat_yaml, so it is kept off the import path. libyaml's C loader
+    parses several times faster than the pure-Python one; it is only
+    available when PyYAML was built against libyaml.
+    
+    Returns:
+        type: yaml.CSafeLoader if available, otherwise yaml.SafeLoader
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
+
+
+def _loader_workers() -> int:
+    """
+    Get the number of threads to use for loading projects.
+    
+    Returns:
+        int: Value of OSS_FUZZ_MAX_WORKERS if it is a positive integer, otherwise the default
+    """
+    try:
+        workers = int(os.getenv("OSS_FUZZ_MAX_WORKERS", _DEFAULT_LOADER_WORKERS))
+    except ValueError:
+        return _DEFAULT_LOADER_WORKERS
+    return workers if workers > 0 else _DEFAULT_LOADER_WORKERS
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern a string read from project.yaml.
+    
+    Args:
+        value: Value from project.yaml
+        
+    Returns:
+        The interned string, or the value unchanged if it is not a string
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _logical_lines(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Join shell lines continued with a trailing backslash.
+    
+    Args:
+        lines (Iterable[bytes]): Physical lines, such as a file opened in binary mode
+        
+    Yields:
+        bytes: Logical lines, with each continuation replaced by a space
+    """
+    pending = b""
+    for line in lines:
+        stripped = line.rstrip(b"\r\n")
+        if stripped.endswith(b"\\"):
+            pending += stripped[:-1] + b" "
+            continue
+        yield pending + line
+        pending = b""
+    if pending:
+        yield pending
+
+
+def _yaml_scalar(text: str) -> Any:
+    """
+    Convert a project.yaml value in the flat subset to a Python object.
+    
+    Args:
+        text (str): Value with surrounding spaces removed
+        
+    Returns:
+        The value as PyYAML's safe loader would return it
+        
+    Raises:
+        ValueError: If the value is outside the subset
+    """
+    if text[:1] in ('"', "'"):
+        inner = text[1:-1]
+        if len(text) < 2 or text[-1] != text[0] or text[0] in inner or "\\" in inner:
+            raise ValueError(text)
+        return inner
+    if text[:1] == "[" and text[-1:] == "]":
+        inner = text[1:-1]
+        if any(c in inner for c in "[]{}"):
+            raise ValueError(text)
+        return [_yaml_scalar(item.strip()) for item in inner.split(",")] if inner.strip() else []
+    if text in _YAML_CONSTANTS:
+        return _YAML_CONSTANTS[text]
+    if _YAML_INT_RE.match(text):
+        return int(text)
+    # Plain strings must start with a letter so that numbers, dates and
+    # YAML indicators all take the PyYAML path
+    if not (text[:1].isalpha() or text[:1] == "_") or ": " in text or " #" in text or text.endswith(":"):
+        raise ValueError(text)
+    return text
+
+
+def _parse_flat_yaml(data: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Parse a project.yaml file in the flat subset without PyYAML.
+    
+    Args:
+        data (bytes): Contents of the file
+        
+    Returns:
+        Optional[Dict[str, Any]]: Parsed configuration, or None if the file
+        is outside the subset and needs a full YAML parser
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    
+    config = {}
+    # Key whose value is empty, which any following "- item" lines belong
+    # to, and the indentation of those lines
+    list_key = None
+    list_indent = None
+    try:
+        for line in text.splitlines():
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            if "\t" in line:
+                raise ValueError(line)
+            
+            item = stripped[0] == "-" and _YAML_ITEM_RE.match(line)
+            if item:
+                indent, value = item.groups()
+                if list_key is None or list_indent not in (None, indent):
+                    raise ValueError(line)
+                if config[list_key] is None:
+                    config[list_key] = []
+                    list_indent = indent
+                config[list_key].append(_yaml_scalar(value))
+                continue
+            
+            entry = _YAML_KEY_RE.match(line)
+            if not entry or entry.group(1) in _YAML_CONSTANTS:
+                raise ValueError(line)
+            key, value = entry.groups()
+            if value:
+                config[key] = _yaml_scalar(value)
+                list_key = None
+            else:
+                config[key] = None
+                list_key = key
+            list_indent = None
+    except ValueError:
+        return None
+    
+    return config or None
+
+
+def _json_safe(value: Any) -> bool:
+    """
+    Check whether a value can be written as JSON.
+    
+    Args:
+        value: Value to check
+        
+    Returns:
+        bool: True if json.dumps accepts the value
+    """
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _gcp_creds_available() -> bool:
+    """
+    Check if GCP credentials are available.
+    
+    The result is memoized, so the filesystem is probed at most once per
+    process however many clients ask.
+    
+    Returns:
+        bool: True if credentials are available, False otherwise
+    """
+    # Check for Application Default Credentials
+    creds_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+    if creds_path and os.path.isfile(creds_path):
+        return True
+    
+    # Check for gcloud default credentials
+    home = os.path.expanduser("~")
+    default_creds = os.path.join(home, ".config", "gcloud", "application_default_credentials.json")
+    if os.path.isfile(default_creds):
+        return True
+    
+    return False
+
 class OSSFuzzClient:
     """
     Client for interacting with OSS-Fuzz services and local repository.
@@ -33,27 +285,54 @@ class OSSFuzzClient:
         self.oss_fuzz_url = "https://github.com/google/oss-fuzz.git"
         self.cached_projects = None
         
-        # Check for GCP credentials
-        self.has_gcp_credentials = self._check_gcp_credentials()
+        # Last oss_fuzz_dir value confirmed to exist by get_oss_fuzz_dir
+        self._oss_fuzz_dir_resolved: Optional[str] = None
+        
+        # Last checkout found by _find_oss_fuzz_repo
+        self._found_oss_fuzz_dir: Optional[Path] = None
+        
+        # Parsed project.yaml files keyed by path, validated by mtime and size
+        self._config_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        self._config_cache_loaded_from: Optional[Path] = None
+        self._config_cache_dirty = False
         
         if self.oss_fuzz_dir:
-            logger.info(f"Using OSS-Fuzz repository at: {self.oss_fuzz_dir}")
+            logger.info("Using OSS-Fuzz repository at: %s", self.oss_fuzz_dir)
         else:
             logger.warning("OSS-Fuzz repository not found. Some functionality will be limited.")
-            
-        if self.has_gcp_credentials:
+    
+    @functools.cached_property
+    def has_gcp_credentials(self) -> bool:
+        """
+        Whether GCP credentials are available, checked on first access.
+        
+        The client is created when the package is imported, so deferring the
+        filesystem probes keeps them off the import path.
+        
+        Returns:
+            bool: True if credentials are available, False otherwise
+        """
+        has_credentials = _gcp_creds_available()
+        if has_credentials:
             logger.info("GCP credentials found. Service integration enabled.")
         else:
             logger.warning("GCP credentials not found. Service integration disabled.")
+        return has_credentials
     
     def _find_oss_fuzz_repo(self) -> Optional[Path]:
         """
         Find OSS-Fuzz repository in common locations.
         
+        A location found once is remembered and only checked again, while a
+        failed search is not, so a checkout created later is still found.
+        
         Returns:
             Optional[Path]: Path to OSS-Fuzz repository, or None if not found
         """
-        # Check common locations
+        found = self._found_oss_fuzz_dir
+        if found and (found / "infra").is_dir():
+            return found
+        
         common_locations = [
             # Current directory
             Path.cwd() / "oss-fuzz",
@@ -63,48 +342,35 @@ class OSSFuzzClient:
             Path.home() / "oss-fuzz",
             # Temp directory (for tests)
             Path(tempfile.gettempdir()) / "oss-fuzz",
-            # Environment variable
-            Path(os.environ.get("OSS_FUZZ_DIR", "nonexistent"))
         ]
+        # Environment variable
+        if os.environ.get("OSS_FUZZ_DIR"):
+            common_locations.append(Path(os.environ["OSS_FUZZ_DIR"]))
         
         for location in common_locations:
+            # Every OSS-Fuzz checkout has infra/, which sets it apart from
+            # unrelated directories of the same name
             if location.is_dir() and (location / "infra").is_dir():
+                self._found_oss_fuzz_dir = location
                 return location
         
         return None
     
-    def _check_gcp_credentials(self) -> bool:
-        """
-        Check if GCP credentials are available.
-        
-        Returns:
-            bool: True if credentials are available, False otherwise
-        """
-        # Check for Application Default Credentials
-        creds_path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
-        if creds_path and os.path.isfile(creds_path):
-            return True
-        
-        # Check for gcloud default credentials
-        home = os.path.expanduser("~")
-        default_creds = os.path.join(home, ".config", "gcloud", "application_default_credentials.json")
-        if os.path.isfile(default_creds):
-            return True
-        
-        return False
-    
-    def clone_oss_fuzz_repo(self, target_dir: Optional[str] = None) -> Path:
+    def clone_oss_fuzz_repo(self, target_dir: Optional[str] = None, refresh: bool = False) -> Path:
         """
         Clone the OSS-Fuzz repository.
         
         Args:
             target_dir (str, optional): Directory to clone into
+            refresh (bool, optional): Update an existing clone to the latest commit
             
         Returns:
             Path: Path to the cloned repository
             
         Raises:
-            subprocess.CalledProcessError: If clone fails
+            subprocess.CalledProcessError: If clone or refresh fails
+            FileExistsError: If refresh is requested for a directory that is
+                not a git checkout
         """
         if target_dir:
             target_path = Path(target_dir)
@@ -112,19 +378,65 @@ class OSSFuzzClient:
             target_path = Path.cwd() / "oss-fuzz"
             
         if target_path.exists():
-            logger.warning(f"Directory {target_path} already exists, skipping clone")
+            if not refresh:
+                logger.warning("Directory %s already exists, skipping clone", target_path)
+                self.oss_fuzz_dir = target_path
+                return target_path
+            
+            # Without its own .git, git would act on whatever repository
+            # encloses the directory and reset that one instead
+            if not (target_path / ".git").is_dir():
+                raise FileExistsError(
+                    f"{target_path} exists but is not a git checkout; remove it or pass another target_dir"
+                )
+            
+            # Fetching just the new tip into the existing clone transfers
+            # far less than cloning again
+            logger.info("Refreshing OSS-Fuzz repository at %s", target_path)
+            subprocess.check_call([
+                "git", "-C", str(target_path), "fetch",
+                "--depth=1", "--filter=blob:none", "--no-tags", "origin", "HEAD"
+            ])
+            subprocess.check_call(["git", "-C", str(target_path), "reset", "--hard", "FETCH_HEAD"])
+            
             self.oss_fuzz_dir = target_path
+            self.invalidate_project_cache()
             return target_path
             
-        # Clone the repository
-        logger.info(f"Cloning OSS-Fuzz repository to {target_path}")
+        # Clone only the latest commit, fetching blobs on demand, and check
+        # out just the directories this module reads. Submodules are never
+        # needed for reading projects/ and are explicitly left out; should
+        # that change, add --recurse-submodules --shallow-submodules with
+        # --jobs set to the CPU count rather than fetching them serially.
+        logger.info("Cloning OSS-Fuzz repository to %s", target_path)
+        subprocess.check_call([
+            "git", "-c", "protocol.version=2", "clone",
+            "--depth=1", "--filter=blob:none", "--single-branch", "--no-tags", "--no-checkout",
+            "--no-recurse-submodules",
+            self.oss_fuzz_url, str(target_path)
+        ])
         subprocess.check_call(
-            ["git", "clone", "https://github.com/google/oss-fuzz.git", str(target_path)]
+            ["git", "-C", str(target_path), "sparse-checkout", "set", "--cone", *_SPARSE_CHECKOUT_DIRS]
         )
+        subprocess.check_call(["git", "-C", str(target_path), "checkout"])
         
         self.oss_fuzz_dir = target_path
+        self.invalidate_project_cache()
         return target_path
     
+    def invalidate_project_cache(self) -> None:
+        """
+        Forget project names and parsed project.yaml files held in memory.
+        
+        Cached configs are validated by modification time and size, but
+        project names are kept until the checkout changes, so call this after
+        projects are added to or removed from the current checkout.
+        """
+        self.cached_projects = None
+        self._config_cache.clear()
+        self._config_cache_loaded_from = None
+        self._config_cache_dirty = False
+    
     def get_projects_from_repo(self) -> List[OSSFuzzProject]:
         """
         Get list of projects from OSS-Fuzz repository.
@@ -138,22 +450,197 @@ class OSSFuzzClient:
         if not self.oss_fuzz_dir:
             raise FileNotFoundError("OSS-Fuzz repository not found")
             
-        projects_dir = Path(self.oss_fuzz_dir) / "projects"
-        if not projects_dir.exists():
-            raise FileNotFoundError(f"Projects directory not found: {projects_dir}")
-            
-        projects = []
-        for project_dir in projects_dir.iterdir():
-            if project_dir.is_dir():
-                try:
-                    project = self.get_project_details_from_repo(project_dir.name)
-                    if project:
-                        projects.append(project)
-                except Exception as e:
-                    logger.warning(f"Failed to get details for project {project_dir.name}: {e}")
-                    
-        return projects
+        projects_dir = os.path.join(self.oss_fuzz_dir, "projects")
+        
+        # scandir entries answer is_dir() from the directory listing itself,
+        # so no per-project stat is needed
+        try:
+            with os.scandir(projects_dir) as entries:
+                project_names = [entry.name for entry in entries if entry.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Projects directory not found: {projects_dir}") from None
+        
+        # Nothing to load, e.g. in a partial or broken checkout, so skip the
+        # disk cache and thread pool start-up
+        if not project_names:
+            return []
+        
+        cache_path = self._config_cache_path()
+        self._load_config_cache(cache_path)
+        
+        # Loading is dominated by file I/O, so a thread pool overlaps the
+        # per-project stat/open/read latency
+        with ThreadPoolExecutor(max_workers=_loader_workers()) as executor:
+            loaded = list(executor.map(self._load_project_from_repo, project_names))
+        
+        if self._config_cache_dirty:
+            self._save_config_cache(cache_path)
+            
+        return [project for project in loaded if project]
+    
+    def _config_cache_path(self) -> Path:
+        """
+        Get the on-disk cache of parsed project.yaml files for the current checkout.
+        
+        Returns:
+            Path: Path of the cache file
+        """
+        digest = hashlib.blake2b(str(self.oss_fuzz_dir).encode(), digest_size=8).hexdigest()
+        return get_cache_dir() / f"project-configs-{digest}.json"
+    
+    def _load_config_cache(self, cache_path: Path) -> None:
+        """
+        Merge parsed project.yaml files from the on-disk cache, once per cache file.
+        
+        Missing or unreadable cache files are ignored.
+        
+        Args:
+            cache_path (Path): Path of the cache file
+        """
+        if self._config_cache_loaded_from == cache_path:
+            return
+        self._config_cache_loaded_from = cache_path
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                data = json.load(f)
+            if data.get("version") != _CONFIG_CACHE_VERSION:
+                return
+            for path, (mtime_ns, size, config) in data["entries"].items():
+                self._config_cache.setdefault(path, (mtime_ns, size, config))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug("Ignoring unreadable project config cache %s: %s", cache_path, e)
+    
+    def _save_config_cache(self, cache_path: Path) -> None:
+        """
+        Atomically write the parsed project.yaml files to the on-disk cache.
+        
+        Configs that cannot be represented in JSON are left out; failures are
+        logged and otherwise ignored.
+        
+        Args:
+            cache_path (Path): Path of the cache file
+        """
+        entries = dict(self._config_cache)
+        try:
+            data = json.dumps({"version": _CONFIG_CACHE_VERSION, "entries": entries})
+        except (TypeError, ValueError):
+            entries = {path: entry for path, entry in entries.items() if _json_safe(entry)}
+            data = json.dumps({"version": _CONFIG_CACHE_VERSION, "entries": entries})
+        
+        try:
+            write_file_atomic(cache_path, data.encode('utf-8'))
+            self._config_cache_dirty = False
+        except OSError as e:
+            logger.debug("Failed to write project config cache %s: %s", cache_path, e)
     
+    def _read_project_config(self, project_yaml: Union[str, Path],
+                             stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """
+        Parse a project.yaml file, reusing the cached result while it is unmodified.
+        
+        Args:
+            project_yaml (str or Path): Path of the project.yaml file
+            stat (os.stat_result, optional): Status of the file, if already known
+            
+        Returns:
+            Dict[str, Any]: Parsed project configuration
+            
+        Raises:
+            FileNotFoundError: If the file is not found
+        """
+        key = str(project_yaml)
+        if stat is None:
+            try:
+                stat = os.stat(project_yaml)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Project config not found: {project_yaml}") from None
+        
+        # The size catches edits that leave the mtime unchanged on
+        # filesystems with coarse timestamps
+        mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        
+        cached = self._config_cache.get(key)
+        if cached and cached[0] == mtime_ns and cached[1] == size:
+            return cached[2]
+        
+        # Read the raw bytes with plain os.read calls, skipping Python's
+        # buffered text I/O, and parse them as one buffer
+        fd = os.open(project_yaml, os.O_RDONLY)
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(fd, _READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        data = b"".join(chunks)
+        config = _parse_flat_yaml(data)
+        if config is None:
+            import yaml
+            config = yaml.load(data, Loader=_yaml_loader())
+        
+        self._config_cache[key] = (mtime_ns, size, config)
+        self._config_cache_dirty = True
+        return config
+    
+    def _load_project_from_repo(self, project_name: str) -> Optional[OSSFuzzProject]:
+        """
+        Load project details from OSS-Fuzz repository, logging failures.
+        
+        Args:
+            project_name (str): Name of the OSS-Fuzz project
+            
+        Returns:
+            Optional[OSSFuzzProject]: Project details, or None if they could not be loaded
+        """
+        try:
+            return self.get_project_details_from_repo(project_name)
+        except Exception as e:
+            logger.warning("Failed to get details for project %s: %s", project_name, e)
+            return None
+    
+    def get_project_details(self, project_name: str) -> Dict[str, Any]:
+        """
+        Get details about a specific OSS-Fuzz project.
+        
+        Deprecated: use get_project_details_from_repo, which returns the
+        parsed project as an OSSFuzzProject.
+        
+        Args:
+            project_name (str): Name of the OSS-Fuzz project
+            
+        Returns:
+            Dict: Name and path of the project and which project files exist,
+            or an "error" entry if the project is not found
+        """
+        warnings.warn(
+            "OSSFuzzClient.get_project_details is deprecated; use get_project_details_from_repo",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        oss_fuzz_dir = self.get_oss_fuzz_dir()
+        if not oss_fuzz_dir:
+            return {"error": "OSS-Fuzz repository not found"}
+        
+        project_dir = os.path.join(oss_fuzz_dir, "projects", project_name)
+        if not os.path.isdir(project_dir):
+            return {"error": f"Project {project_name} not found"}
+        
+        result = {
+            "name": project_name,
+            "path": project_dir,
+        }
+        if os.path.exists(os.path.join(project_dir, "project.yaml")):
+            result["yaml_exists"] = True
+        if os.path.exists(os.path.join(project_dir, "Dockerfile")):
+            result["dockerfile_exists"] = True
+        return result
+
     def get_project_details_from_repo(self, project_name: str) -> OSSFuzzProject:
         """
         Get project details from OSS-Fuzz repository.
@@ -170,35 +657,61 @@ class OSSFuzzClient:
         if not self.oss_fuzz_dir:
             raise FileNotFoundError("OSS-Fuzz repository not found")
             
-        project_dir = Path(self.oss_fuzz_dir) / "projects" / project_name
-        if not project_dir.exists():
-            raise FileNotFoundError(f"Project directory not found: {project_dir}")
+        # Paths are built as plain strings on this per-project path; only the
+        # returned objects hold Path instances
+        project_dir = os.path.join(self.oss_fuzz_dir, "projects", project_name)
+        
+        # One directory read answers every file presence check below. The
+        # entry types come from the listing itself, and on Windows so does
+        # the project.yaml status.
+        try:
+            with os.scandir(project_dir) as entries:
+                files = {entry.name: entry for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Project directory not found: {project_dir}") from None
             
         # Read project.yaml
-        project_yaml = project_dir / "project.yaml"
-        if not project_yaml.exists():
-            raise FileNotFoundError(f"Project config not found: {project_yaml}")
+        yaml_entry = files.get("project.yaml")
+        if yaml_entry is None:
+            raise FileNotFoundError(f"Project config not found: {os.path.join(project_dir, 'project.yaml')}")
+        config = self._read_project_config(yaml_entry.path, yaml_entry.stat())
             
-        with open(project_yaml) as f:
-            config = yaml.safe_load(f)
-            
-        # Create project instance
+        # Create project instance. Languages, sanitizers and engines come from
+        # a small vocabulary shared by all projects, so they are interned.
         project = OSSFuzzProject(
             name=project_name,
-            path=str(project_dir),
-            language=config.get("language", "unknown"),
+            path=project_dir,
+            language=_intern(config.get("language", "unknown")),
             main_repo=config.get("main_repo", ""),
-            sanitizers=config.get("sanitizers", []),
-            fuzzing_engines=config.get("fuzzing_engines", []),
-            architectures=config.get("architectures", []),
-            maintainers=config.get("auto_ccs", []),
-            has_dockerfile=os.path.exists(project_dir / "Dockerfile"),
-            has_build_script=os.path.exists(project_dir / "build.sh"),
-            config=config
+            # Empty list keys in project.yaml parse as None
+            sanitizers=[_intern(s) for s in config.get("sanitizers") or []],
+            fuzzing_engines=[_intern(e) for e in config.get("fuzzing_engines") or []],
+            architectures=config.get("architectures") or [],
+            maintainers=config.get("auto_ccs") or [],
+            has_dockerfile="Dockerfile" in files,
+            has_build_script="build.sh" in files,
+            # Copied so that callers cannot modify the cached config
+            config=dict(config)
         )
         
         return project
 
+    def get_project_with_targets(self, project_name: str) -> Tuple[OSSFuzzProject, List[FuzzTarget]]:
+        """
+        Get project details together with the project's fuzz targets.
+        
+        Args:
+            project_name (str): Name of the OSS-Fuzz project
+            
+        Returns:
+            Tuple[OSSFuzzProject, List[FuzzTarget]]: Project details and its fuzz targets
+            
+        Raises:
+            FileNotFoundError: If project or config is not found
+        """
+        project = self.get_project_details_from_repo(project_name)
+        return project, self.get_fuzz_targets(project)
+
     def get_fuzz_targets(self, project: OSSFuzzProject) -> List[FuzzTarget]:
         """
         Get available fuzz targets for a project.
@@ -209,49 +722,133 @@ class OSSFuzzClient:
         Returns:
             List[FuzzTarget]: List of available fuzz targets
         """
-        targets = []
-        
-        # Try to find targets from build.sh
-        build_script = Path(project.path) / "build.sh"
-        if build_script.exists():
-            try:
-                with open(build_script, 'r') as f:
-                    content = f.read()
-                    # Look for compilation of fuzz targets (common patterns)
-                    fuzz_patterns = [
-                        r'\$CXX.*\$CXXFLAGS.*\$LIB_FUZZING_ENGINE.*-o\s+(\$OUT/[\w_-]+)',
-                        r'cp\s+[\w_-]+\s+(\$OUT/[\w_-]+)',
-                        r'compile_go_fuzzer\s+[\w\./]+\s+([\w_-]+)',
-                        r'compile_rust_fuzzer\s+[\w\./]+\s+([\w_-]+)'
-                    ]
-                    
-                    for pattern in fuzz_patterns:
-                        matches = re.findall(pattern, content)
-                        for match in matches:
-                            # Extract just the filename from paths like $OUT/fuzzer_name
-                            target_name = os.path.basename(match.replace('$OUT/', ''))
-                            if target_name:
-                                target = FuzzTarget(
-                                    name=target_name,
-                                    project=project,
-                                    build_script=build_script
-                                )
-                                targets.append(target)
-            except Exception as e:
-                logger.warning(f"Failed to parse build script for {project.name}: {e}")
+        targets = list(self._iter_fuzz_targets(project))
         
         # If no targets found, provide some common naming patterns
         if not targets:
-            # Common naming pattern: project_fuzzer
-            target = FuzzTarget(
-                name=f"{project.name}_fuzzer",
-                project=project,
-                build_script=build_script if build_script.exists() else None
-            )
-            targets.append(target)
+            targets.append(self._default_fuzz_target(project))
         
         return targets
 
+    def get_first_fuzz_target(self, project: OSSFuzzProject) -> FuzzTarget:
+        """
+        Get the first available fuzz target for a project.
+        
+        Equivalent to get_fuzz_targets(project)[0], but stops scanning the
+        build script as soon as a target is found.
+        
+        Args:
+            project (OSSFuzzProject): The project to get the target for
+            
+        Returns:
+            FuzzTarget: The first available fuzz target
+        """
+        target = next(self._iter_fuzz_targets(project), None)
+        return target if target else self._default_fuzz_target(project)
+
+    def find_fuzz_target(self, project: OSSFuzzProject, name: str) -> Optional[FuzzTarget]:
+        """
+        Find a fuzz target of a project by name.
+        
+        Stops scanning the build script as soon as the target is found.
+        
+        Args:
+            project (OSSFuzzProject): The project to search
+            name (str): Name of the fuzz target
+            
+        Returns:
+            Optional[FuzzTarget]: The fuzz target, or None if the project has no such target
+        """
+        found_any = False
+        for target in self._iter_fuzz_targets(project):
+            if target.name == name:
+                return target
+            found_any = True
+        
+        # Without any detected targets, get_fuzz_targets offers the conventional name
+        if not found_any and name == f"{project.name}_fuzzer":
+            return self._default_fuzz_target(project)
+        return None
+
+    def _iter_fuzz_targets(self, project: OSSFuzzProject) -> Iterator[FuzzTarget]:
+        """
+        Lazily yield the fuzz targets found in a project's build.sh.
+        
+        Args:
+            project (OSSFuzzProject): The project to get targets for
+            
+        Returns:
+            Iterator[FuzzTarget]: Fuzz targets grouped by the pattern that
+            found them, in pattern priority order and then in file order,
+            without duplicates
+        """
+        seen = set()
+        
+        # Targets of the first pattern come first in the result, so they are
+        # handed out as soon as they are found. Names found by the other
+        # patterns are held back until the whole script has been scanned.
+        first, *rest = _FUZZ_TARGET_PATTERNS
+        deferred: List[List[bytes]] = [[] for _ in rest]
+        
+        # Try to find targets from build.sh. The Path handed out with the
+        # targets is only built once a target is found.
+        build_script = os.path.join(project.path, "build.sh")
+        build_script_path = None
+        
+        def _new_targets(names: Iterable[bytes]) -> Iterator[FuzzTarget]:
+            nonlocal build_script_path
+            for raw_name in names:
+                name = raw_name.decode('ascii')
+                if name not in seen:
+                    seen.add(name)
+                    if build_script_path is None:
+                        build_script_path = Path(build_script)
+                    yield FuzzTarget(
+                        name=name,
+                        project=project,
+                        build_script=build_script_path
+                    )
+        
+        try:
+            # The patterns are line-local, so the script is streamed one
+            # logical line at a time rather than read whole. This bounds
+            # memory and keeps any regex backtracking within a single line.
+            with open(build_script, 'rb') as f:
+                for line in _logical_lines(f):
+                    # Cheap substring checks reject most lines before any regex runs
+                    if not any(literal in line for literal in _FUZZ_TARGET_LITERALS):
+                        continue
+                    
+                    # Look for compilation of fuzz targets (common patterns)
+                    yield from _new_targets(first.findall(line))
+                    for names, pattern in zip(deferred, rest):
+                        names.extend(pattern.findall(line))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("Failed to parse build script for %s: %s", project.name, e)
+        
+        for names in deferred:
+            yield from _new_targets(names)
+
+    def _default_fuzz_target(self, project: OSSFuzzProject) -> FuzzTarget:
+        """
+        Build the conventionally named fuzz target used when none are detected.
+        
+        Args:
+            project (OSSFuzzProject): The project to build the target for
+            
+        Returns:
+            FuzzTarget: Fuzz target named <project>_fuzzer
+        """
+        # Common naming pattern: project_fuzzer
+        build_script = os.path.join(project.path, "build.sh")
+        return FuzzTarget(
+            name=f"{project.name}_fuzzer",
+            project=project,
+            build_script=Path(build_script) if os.path.exists(build_script) else None
+        )
+
     def setup_fuzzing(self, project: OSSFuzzProject, target: FuzzTarget,
                      output_dir: Optional[Path] = None,
                      architecture: str = "x86_64",
@@ -274,10 +871,13 @@ class OSSFuzzClient:
             
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Read the clock once; the session has not run yet, so it ends where it starts
+        now = datetime.now()
         execution = FuzzingExecution(
             project=project,
             target=target,
-            start_time=datetime.now(),
+            start_time=now,
+            end_time=now,
             output_dir=output_dir,
             environment_vars={
                 "ARCHITECTURE": architecture,
@@ -285,11 +885,25 @@ class OSSFuzzClient:
             }
         )
         
-        # For demonstration, since we can't actually build locally without proper setup
+        # For demonstration, since we can't actually build locally without proper setup.
+        # Keep any binary already in place so repeated setups of the same
+        # output directory don't rewrite it.
         fuzz_target_path = output_dir / target.name
-        with open(fuzz_target_path, 'w') as f:
-            f.write("#!/bin/bash\necho 'This is a placeholder for the actual fuzz target binary'")
-        os.chmod(fuzz_target_path, 0o755)
+        try:
+            fd = os.open(fuzz_target_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o755)
+        except FileExistsError:
+            pass
+        else:
+            try:
+                os.write(fd, _PLACEHOLDER_FUZZ_TARGET)
+                # The creation mode is subject to the umask
+                if hasattr(os, "fchmod"):
+                    os.fchmod(fd, 0o755)
+            finally:
+                os.close(fd)
+            # os.fchmod is not available on Windows before Python 3.13
+            if not hasattr(os, "fchmod"):
+                os.chmod(fuzz_target_path, 0o755)
         
         return execution
 
@@ -357,7 +971,8 @@ class OSSFuzzClient:
             "project": project_name
         }
     
-    def download_corpus(self, project_name: str, fuzzer_name: str, output_dir: str) -> Dict[str, Any]:
+    def download_corpus(self, project_name: str, fuzzer_name: str, output_dir: str,
+                        simulate: bool = True) -> Dict[str, Any]:
         """
         Download corpus for a specific project and fuzzer.
         
@@ -365,6 +980,8 @@ class OSSFuzzClient:
             project_name (str): Name of the project
             fuzzer_name (str): Name of the fuzzer
             output_dir (str): Directory to save the corpus
+            simulate (bool, optional): Write random sample inputs; when False,
+                only a README with instructions is written (default: True)
             
         Returns:
             Dict: Results of the download operation
@@ -372,6 +989,23 @@ class OSSFuzzClient:
         # Create the output directory
         os.makedirs(output_dir, exist_ok=True)
         
+        if simulate:
+            # Create some sample corpus files, drawing the random bytes for
+            # all of them at once
+            data = os.urandom(5 * 100)
+            for i in range(5):
+                with open(os.path.join(output_dir, f"sample_{i}"), 'wb') as f:
+                    f.write(data[i * 100:(i + 1) * 100])
+            
+            return {
+                "success": True,
+                "warning": "This is a simulated corpus. Actual corpus requires OSS-Fuzz service access.",
+                "output_dir": output_dir,
+                "files_created": 5,
+                "project": project_name,
+                "fuzzer": fuzzer_name
+            }
+        
         # Create a placeholder file with instructions
         sample_file = os.path.join(output_dir, "README.txt")
         with open(sample_file, 'w') as f:
@@ -393,19 +1027,18 @@ class OSSFuzzClient:
         Get the path to the OSS-Fuzz repository.
         Returns None if not found.
         """
+        # The directory is only checked again when oss_fuzz_dir is changed
+        if self.oss_fuzz_dir and self.oss_fuzz_dir == self._oss_fuzz_dir_resolved:
+            return self.oss_fuzz_dir
+        
         if self.oss_fuzz_dir and os.path.exists(self.oss_fuzz_dir):
+            self._oss_fuzz_dir_resolved = self.oss_fuzz_dir
             return self.oss_fuzz_dir
-            
-        # Check common locations
-        locations = [
-            os.path.expanduser("~/oss-fuzz"),
-            os.path.join(os.getcwd(), "oss-fuzz"),
-        ]
         
-        for loc in locations:
-            if os.path.exists(loc) and os.path.exists(os.path.join(loc, "projects")):
-                self.oss_fuzz_dir = loc
-                return loc
+        location = self._find_oss_fuzz_repo()
+        if location:
+            self.oss_fuzz_dir = self._oss_fuzz_dir_resolved = str(location)
+            return self.oss_fuzz_dir
                 
         return None
     
@@ -414,13 +1047,15 @@ class OSSFuzzClient:
         Check if GCP credentials are available.
         Returns True if credentials are available, False otherwise.
         """
-        # This is a placeholder - actual GCP auth would need to be implemented
-        return False
+        return _gcp_creds_available()
     
     def clone_oss_fuzz(self, target_dir: Optional[str] = None) -> Optional[Path]:
         """
         Clone the OSS-Fuzz repository.
         
+        Same as clone_oss_fuzz_repo, but cloning into ~/oss-fuzz by default
+        and returning None instead of raising on failure.
+        
         Args:
             target_dir: Directory to clone OSS-Fuzz to
             
@@ -431,22 +1066,9 @@ class OSSFuzzClient:
             target_dir = os.path.expanduser("~/oss-fuzz")
             
         try:
-            if os.path.exists(target_dir):
-                logger.info(f"OSS-Fuzz repository already exists at {target_dir}")
-                self.oss_fuzz_dir = Path(target_dir)
-                return self.oss_fuzz_dir
-                
-            logger.info(f"Cloning OSS-Fuzz repository to {target_dir}")
-            # Use subprocess to clone the repository
-            # In a real implementation, this would run git clone
-            os.makedirs(target_dir, exist_ok=True)
-            os.makedirs(os.path.join(target_dir, "projects"), exist_ok=True)
-            
-            self.oss_fuzz_dir = Path(target_dir)
-            return self.oss_fuzz_dir
-            
+            return self.clone_oss_fuzz_repo(target_dir)
         except Exception as e:
-            logger.error(f"Failed to clone OSS-Fuzz: {e}")
+            logger.error("Failed to clone OSS-Fuzz: %s", e)
             return None
     
     def get_projects(self) -> List[str]:
@@ -456,97 +1078,31 @@ class OSSFuzzClient:
         Returns:
             List of project names
         """
-        if self.cached_projects:
-            return self.cached_projects
-            
         oss_fuzz_dir = self.get_oss_fuzz_dir()
         if not oss_fuzz_dir:
             return []
+        
+        # Names are cached per checkout, so pointing the client at another
+        # repository lists that one afresh
+        if self.cached_projects and self.cached_projects[0] == oss_fuzz_dir:
+            return self.cached_projects[1]
             
         projects_dir = os.path.join(oss_fuzz_dir, "projects")
-        if not os.path.exists(projects_dir):
-            return []
-            
-        # Get subdirectories in the projects directory
+        
+        # Get subdirectories in the projects directory. scandir reports the
+        # entry type from the directory listing itself, so this needs no
+        # stat call per project
         try:
-            projects = [d for d in os.listdir(projects_dir) 
-                      if os.path.isdir(os.path.join(projects_dir, d))]
-            self.cached_projects = projects
-            return projects
+            with os.scandir(projects_dir) as it:
+                projects = [entry.name for entry in it if entry.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            return []
         except Exception as e:
-            logger.error(f"Failed to list projects: {e}")
+            logger.error("Failed to list projects: %s", e)
             return []
-    
-    def get_project_details(self, project_name: str) -> Dict[str, Any]:
-        """
-        Get details about a specific OSS-Fuzz project.
-        
-        Args:
-            project_name: Name of the OSS-Fuzz project
-            
-        Returns:
-            Dictionary with project details
-        """
-        oss_fuzz_dir = self.get_oss_fuzz_dir()
-        if not oss_fuzz_dir:
-            return {"error": "OSS-Fuzz repository not found"}
-            
-        project_dir = os.path.join(oss_fuzz_dir, "projects", project_name)
-        if not os.path.exists(project_dir):
-            return {"error": f"Project {project_name} not found"}
-            
-        result = {
-            "name": project_name,
-            "path": project_dir,
-        }
-        
-        # Try to get project.yaml
-        yaml_path = os.path.join(project_dir, "project.yaml")
-        if os.path.exists(yaml_path):
-            # In a real implementation, this would parse the YAML file
-            result["yaml_exists"] = True
-        
-        # Try to get Dockerfile
-        dockerfile_path = os.path.join(project_dir, "Dockerfile")
-        if os.path.exists(dockerfile_path):
-            result["dockerfile_exists"] = True
         
-        return result
-
-    def download_corpus(self, project_name: str, 
-                        fuzzer_name: str,
-                        output_dir: str) -> Dict[str, Any]:
-        """
-        Download corpus for a specific project and fuzzer.
-        
-        Args:
-            project_name: Name of the OSS-Fuzz project
-            fuzzer_name: Name of the fuzzer
-            output_dir: Directory to save the corpus
-            
-        Returns:
-            Dictionary with results of the download operation
-        """
-        # Create the output directory
-        os.makedirs(output_dir, exist_ok=True)
-        
-        result = {
-            "project": project_name,
-            "fuzzer": fuzzer_name,
-            "output_dir": output_dir,
-            "warning": "This is a simulated corpus. Actual corpus requires OSS-Fuzz service access."
-        }
-        
-        # Create some sample corpus files
-        for i in range(5):
-            with open(os.path.join(output_dir, f"sample_{i}"), 'wb') as f:
-                # Write some random binary data
-                f.write(os.urandom(100))
-        
-        result["files_created"] = 5
-        result["success"] = True
-        
-        return result
+        self.cached_projects = (oss_fuzz_dir, projects)
+        return projects
 
 
 # Create a singleton instance
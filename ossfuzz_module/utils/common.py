@@ -3,13 +3,24 @@ Common utility functions for the OSS-Fuzz API.
 """
 
 import datetime
-import re
+import functools
+import os
+import string
+import tempfile
+from pathlib import Path
 from typing import Dict, Optional, Union
 
+# Characters allowed in names, checked with set operations rather than a regex
+_PROJECT_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "_-")
+_FUZZ_TARGET_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
 def validate_project_name(project_name: str) -> str:
     """
     Validate and normalize the project name.
     
+    Results for valid names are memoized, so repeated calls with the same
+    name are a dictionary lookup.
+    
     Args:
         project_name: Name of the OSS-Fuzz project
         
@@ -21,17 +32,94 @@ def validate_project_name(project_name: str) -> str:
     """
     if not project_name:
         raise ValueError("Project name cannot be empty")
-        
+    
+    # Checked before the memoized part, which would fail on unhashable input
+    if not isinstance(project_name, str):
+        raise ValueError("Project name must be a string")
+    
+    return _normalize_project_name(project_name)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_project_name(project_name: str) -> str:
+    """Normalize a non-empty project name string, memoizing the result."""
     # Remove leading/trailing whitespace and convert to lowercase
     project_name = project_name.strip().lower()
     
     # Check for invalid characters
-    if not re.match(r'^[a-z0-9_-]+$', project_name):
+    if not project_name or not _PROJECT_NAME_CHARS.issuperset(project_name):
         raise ValueError("Project name can only contain lowercase letters, numbers, underscores, and hyphens")
         
     return project_name
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_iso_date(value: str) -> datetime.date:
+    """
+    Parse the date from an ISO format string, memoizing the result.
+    
+    Args:
+        value (str): ISO format date or datetime string
+        
+    Returns:
+        datetime.date: Date part of the value
+        
+    Raises:
+        ValueError: If the string is not in ISO format
+    """
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        # Full timestamps are accepted too, keeping only their date
+        return datetime.datetime.fromisoformat(value).date()
+
+
+def _to_date(value: Union[datetime.date, str], name: str) -> datetime.date:
+    """
+    Convert a date parameter to a date object.
+    
+    Args:
+        value (date, datetime or str): Date object or ISO format string
+        name (str): Name of the parameter, used in error messages
+        
+    Returns:
+        datetime.date: Date part of the value
+        
+    Raises:
+        ValueError: If the string is not in ISO format
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    try:
+        return _parse_iso_date(value)
+    except ValueError:
+        raise ValueError(f"Invalid {name} format: {value}. Use ISO format (YYYY-MM-DD).") from None
+
+
+def _time_of(value: Optional[Union[datetime.date, str]]) -> Optional[datetime.datetime]:
+    """
+    Get a date parameter as a datetime if it has a time component.
+    
+    Args:
+        value (date, datetime or str, optional): Date object or ISO format string
+        
+    Returns:
+        Optional[datetime.datetime]: The value as a datetime, or None if it
+        is missing or a plain date
+    """
+    if isinstance(value, datetime.datetime):
+        return value
+    if not isinstance(value, str):
+        return None
+    try:
+        datetime.date.fromisoformat(value)
+        return None
+    except ValueError:
+        return datetime.datetime.fromisoformat(value)
+
+
 def validate_date_range(start_date: Optional[Union[datetime.datetime, str]] = None,
                         end_date: Optional[Union[datetime.datetime, str]] = None) -> Dict[str, str]:
     """
@@ -47,45 +135,26 @@ def validate_date_range(start_date: Optional[Union[datetime.datetime, str]] = No
     Raises:
         ValueError: If date range is invalid
     """
-    # Default to last 30 days if no dates provided
-    if not start_date and not end_date:
-        end_date = datetime.datetime.now()
-        start_date = end_date - datetime.timedelta(days=30)
-        
-    # If only end_date is provided, set start_date to 30 days before
-    if not start_date and end_date:
-        if isinstance(end_date, str):
-            end_date_obj = datetime.datetime.fromisoformat(end_date)
-        else:
-            end_date_obj = end_date
+    # A missing end date defaults to today, and a missing start date to 30
+    # days before the end date
+    end = _to_date(end_date, "end_date") if end_date else datetime.date.today()
+    if start_date:
+        start = _to_date(start_date, "start_date")
+    else:
+        start = end - datetime.timedelta(days=30)
             
-        start_date = end_date_obj - datetime.timedelta(days=30)
-        
-    # If only start_date is provided, set end_date to today
-    if start_date and not end_date:
-        end_date = datetime.datetime.now()
-        
-    # Convert to datetime objects if strings
-    if isinstance(start_date, str):
-        try:
-            start_date = datetime.datetime.fromisoformat(start_date)
-        except ValueError:
-            raise ValueError(f"Invalid start_date format: {start_date}. Use ISO format (YYYY-MM-DD).")
-            
-    if isinstance(end_date, str):
-        try:
-            end_date = datetime.datetime.fromisoformat(end_date)
-        except ValueError:
-            raise ValueError(f"Invalid end_date format: {end_date}. Use ISO format (YYYY-MM-DD).")
-            
-    # Validate date range
-    if start_date > end_date:
+    # Validate date range, down to the time of day when both values have one
+    start_time = _time_of(start_date)
+    end_time = _time_of(end_date)
+    if start_time and end_time and (start_time.tzinfo is None) == (end_time.tzinfo is None):
+        if start_time > end_time:
+            raise ValueError("start_date cannot be after end_date")
+    elif start > end:
         raise ValueError("start_date cannot be after end_date")
         
-    # Convert to ISO format strings
     return {
-        "start_date": start_date.isoformat().split('T')[0],
-        "end_date": end_date.isoformat().split('T')[0]
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat()
     }
 
 
@@ -109,7 +178,7 @@ def validate_fuzz_target(fuzz_target: str) -> str:
     fuzz_target = fuzz_target.strip()
     
     # Check for invalid characters
-    if not re.match(r'^[a-zA-Z0-9_-]+$', fuzz_target):
+    if not fuzz_target or not _FUZZ_TARGET_NAME_CHARS.issuperset(fuzz_target):
         raise ValueError("Fuzz target name can only contain letters, numbers, underscores, and hyphens")
         
     return fuzz_target
@@ -155,4 +224,39 @@ def format_date(date: Union[datetime.datetime, str]) -> str:
     elif not isinstance(date, datetime.datetime):
         raise ValueError("Date must be a datetime object or ISO format string")
         
-    return date.isoformat() 
\ No newline at end of file
+    return date.isoformat() 
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the directory for caches shared across processes and sessions.
+    
+    Returns:
+        Path: ossfuzz_module directory under $XDG_CACHE_HOME, or ~/.cache if unset
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ossfuzz_module"
+
+
+def write_file_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file so that readers see either the old or the new contents.
+    
+    The data goes to a temporary file in the same directory, which then
+    replaces the target. Missing parent directories are created.
+    
+    Args:
+        path (Path): File to write
+        data (bytes): New contents of the file
+        
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
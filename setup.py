@@ -40,5 +40,8 @@ setup(
             "mypy>=0.800",
             "flake8>=3.8.0",
         ],
+        "speedups": [
+            "orjson>=3.0.0",
+        ],
     },
 ) 
\ No newline at end of file